@@ -11,6 +11,7 @@ Source of truth:
 """
 
 import asyncio
+import copy
 from collections import Counter
 from typing import Any
 
@@ -71,6 +72,26 @@ class NetworkSimulator:
         self._loaded = False
         self.logger: ICSLogger = get_logger(__name__, device="network_simulator")
 
+    @classmethod
+    def from_dict(
+        cls,
+        config: dict[str, Any],
+        system_state: SystemState | None = None,
+    ) -> "NetworkSimulator":
+        """Create a simulator from an already-parsed network configuration.
+
+        Skips the config directory and YAML parsing entirely; load() must
+        still be awaited to build the topology.
+
+        Args:
+            config: Merged configuration, shaped like ConfigLoader.load_all()
+            system_state: System state instance for device validation (optional)
+
+        Returns:
+            Unloaded NetworkSimulator backed by the given configuration
+        """
+        return cls(config_loader=_DictConfigLoader(config), system_state=system_state)
+
     # ----------------------------------------------------------------
     # Configuration loading
     # ----------------------------------------------------------------
@@ -745,3 +766,15 @@ class NetworkSimulator:
             self.services.clear()
             self._loaded = False
             self.logger.info("Network simulator reset")
+
+
+class _DictConfigLoader(ConfigLoader):
+    """ConfigLoader that serves a pre-loaded configuration dict."""
+
+    def __init__(self, config: dict[str, Any]):
+        # No config directory: deliberately skips ConfigLoader.__init__
+        self._config = config
+
+    def load_all(self) -> dict[str, Any]:
+        """Return a copy of the configuration (load() annotates networks)."""
+        return copy.deepcopy(self._config)
@@ -20,13 +20,17 @@ Example Attack:
     $ mbtget -w -a 1 -v 1 localhost:10502  # Trigger trip
 """
 
-from components.network.servers.dnp3_server import DNP3TCPServer
-from components.network.servers.ethernet_ip_server import EtherNetIPServer
-from components.network.servers.iec104_server import IEC104TCPServer
-from components.network.servers.modbus_rtu_server import ModbusRTUServer
-from components.network.servers.modbus_tcp_server import ModbusTCPServer
-from components.network.servers.opcua_server import OPCUAServer
-from components.network.servers.s7_server import S7TCPServer
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from components.network.servers.dnp3_server import DNP3TCPServer
+    from components.network.servers.ethernet_ip_server import EtherNetIPServer
+    from components.network.servers.iec104_server import IEC104TCPServer
+    from components.network.servers.modbus_rtu_server import ModbusRTUServer
+    from components.network.servers.modbus_tcp_server import ModbusTCPServer
+    from components.network.servers.opcua_server import OPCUAServer
+    from components.network.servers.s7_server import S7TCPServer
 
 __all__ = [
     "ModbusTCPServer",
@@ -37,3 +41,28 @@ __all__ = [
     "OPCUAServer",
     "EtherNetIPServer",
 ]
+
+# Servers are imported on first access: each one pulls in its own protocol
+# library (pymodbus, snap7, asyncua, c104, ...), and a run rarely needs all
+_SERVER_MODULES = {
+    "ModbusTCPServer": "components.network.servers.modbus_tcp_server",
+    "ModbusRTUServer": "components.network.servers.modbus_rtu_server",
+    "S7TCPServer": "components.network.servers.s7_server",
+    "DNP3TCPServer": "components.network.servers.dnp3_server",
+    "IEC104TCPServer": "components.network.servers.iec104_server",
+    "OPCUAServer": "components.network.servers.opcua_server",
+    "EtherNetIPServer": "components.network.servers.ethernet_ip_server",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _SERVER_MODULES.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    server_class = getattr(importlib.import_module(module_path), name)
+    globals()[name] = server_class  # Later lookups bypass __getattr__
+    return server_class
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
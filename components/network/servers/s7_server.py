@@ -26,6 +26,7 @@ Based on snap7 library server functionality.
 """
 
 import asyncio
+import struct
 from ctypes import c_uint8
 from typing import Any
 
@@ -36,7 +37,6 @@ try:
     import snap7
     from snap7 import SrvArea
     from snap7.server import Server as Snap7Server
-    from snap7.util import get_bool, get_int, set_bool, set_int
 
     SNAP7_AVAILABLE = True
 except ImportError:
@@ -97,8 +97,20 @@ class S7TCPServer:
         self._running = False
 
         # Memory buffers (allocated when server starts)
-        # Note: snap7 requires ctypes arrays, not Python bytearrays
-        self._db_buffers: dict[int, Any] = {}
+        # Buffers are bytearrays; snap7 gets a ctypes view over the same memory
+        self._db_buffers: dict[int, bytearray] = {}
+        self._db_views: dict[int, Any] = {}
+
+        # Static part of get_info(); "running" is overlaid per call
+        self._info_base: dict[str, Any] = {
+            "protocol": "s7",
+            "host": host,
+            "port": port,
+            "rack": rack,
+            "slot": slot,
+            "running": False,
+            "db_sizes": self.db_sizes,
+        }
 
     @property
     def running(self) -> bool:
@@ -127,13 +139,14 @@ class S7TCPServer:
 
                 # Allocate memory for each DB
                 # Note: snap7 requires ctypes arrays for register_area
+                self._db_views.clear()
                 for db_num, size in self.db_sizes.items():
-                    self._db_buffers[db_num] = (c_uint8 * size)()
+                    self._db_buffers[db_num] = bytearray(size)
                     # Register DB with snap7 server
                     self._server.register_area(
                         SrvArea.DB,  # Area type: Data Block
                         db_num,  # DB number
-                        self._db_buffers[db_num],  # Memory buffer (ctypes array)
+                        self._ctypes_view(db_num),  # ctypes view of the buffer
                     )
 
                 # Start server in background thread
@@ -183,6 +196,7 @@ class S7TCPServer:
                     except Exception:
                         pass
                     self._server = None
+                    self._db_views.clear()
                     self._db_buffers.clear()
 
                 if attempt < max_retries - 1:
@@ -210,6 +224,7 @@ class S7TCPServer:
             self._server = None
 
         # Clear buffers
+        self._db_views.clear()
         self._db_buffers.clear()
 
         # Give OS time to release port
@@ -217,6 +232,18 @@ class S7TCPServer:
 
         self._running = False
 
+    def _ctypes_view(self, db_num: int) -> Any:
+        """Return a ctypes array sharing memory with the DB bytearray.
+
+        The view is cached so snap7 keeps pointing at live memory.
+        """
+        view = self._db_views.get(db_num)
+        if view is None:
+            db_buffer = self._db_buffers[db_num]
+            view = (c_uint8 * len(db_buffer)).from_buffer(db_buffer)
+            self._db_views[db_num] = view
+        return view
+
     # ------------------------------------------------------------------
     # Device sync methods (similar to ModbusTCPServer)
     # ------------------------------------------------------------------
@@ -236,21 +263,37 @@ class S7TCPServer:
 
         try:
             if register_type == "input_registers":
-                # Write to DB1 (input registers): 2 bytes per register
+                # Write to DB1 (input registers): 2 bytes per register,
+                # big-endian signed like snap7.util.set_int
                 db_buffer = self._db_buffers[1]
-                for address, value in device_registers.items():
-                    byte_offset = address * 2
-                    if byte_offset + 1 < len(db_buffer):
-                        set_int(db_buffer, byte_offset, int(value))
+                max_registers = len(db_buffer) // 2
+                addresses = sorted(
+                    a for a in device_registers if 0 <= a < max_registers
+                )
+
+                # Pack each run of consecutive addresses in one slice write
+                run_start = 0
+                for i in range(1, len(addresses) + 1):
+                    if i < len(addresses) and addresses[i] == addresses[i - 1] + 1:
+                        continue
+                    run = addresses[run_start:i]
+                    packed = struct.pack(
+                        f">{len(run)}h", *(int(device_registers[a]) for a in run)
+                    )
+                    byte_offset = run[0] * 2
+                    db_buffer[byte_offset : byte_offset + len(packed)] = packed
+                    run_start = i
 
             elif register_type == "discrete_inputs":
                 # Write to DB3 (discrete inputs): 1 bit per input
                 db_buffer = self._db_buffers[3]
                 for address, value in device_registers.items():
-                    byte_idx = address // 8
-                    bit_idx = address % 8
-                    if byte_idx < len(db_buffer):
-                        set_bool(db_buffer, byte_idx, bit_idx, bool(value))
+                    byte_idx, bit_idx = divmod(address, 8)
+                    if 0 <= byte_idx < len(db_buffer):
+                        if value:
+                            db_buffer[byte_idx] |= 1 << bit_idx
+                        else:
+                            db_buffer[byte_idx] &= ~(1 << bit_idx) & 0xFF
 
         except Exception as e:
             logger.debug(f"Error syncing from device to S7 server: {e}")
@@ -272,27 +315,30 @@ class S7TCPServer:
         if not self._running or not self._server:
             return {}
 
-        result = {}
+        result: dict[int, Any] = {}
 
         try:
             if register_type == "coils":
-                # Read from DB4 (coils)
+                # Read from DB4 (coils): 1 bit per coil, LSB first
                 db_buffer = self._db_buffers[4]
-                for i in range(count):
-                    addr = address + i
-                    byte_idx = addr // 8
-                    bit_idx = addr % 8
-                    if byte_idx < len(db_buffer):
-                        result[addr] = get_bool(db_buffer, byte_idx, bit_idx)
+                start = max(address, 0)
+                stop = min(address + count, len(db_buffer) * 8)
+                result = {
+                    addr: bool(db_buffer[addr >> 3] >> (addr & 7) & 1)
+                    for addr in range(start, stop)
+                }
 
             elif register_type == "holding_registers":
-                # Read from DB2 (holding registers)
+                # Read from DB2 (holding registers): one unpack for the
+                # whole in-range span, big-endian signed like snap7.util.get_int
                 db_buffer = self._db_buffers[2]
-                for i in range(count):
-                    addr = address + i
-                    byte_offset = addr * 2
-                    if byte_offset + 1 < len(db_buffer):
-                        result[addr] = get_int(db_buffer, byte_offset)
+                start = max(address, 0)
+                stop = min(address + count, len(db_buffer) // 2)
+                if stop > start:
+                    values = struct.unpack_from(
+                        f">{stop - start}h", db_buffer, start * 2
+                    )
+                    result = dict(zip(range(start, stop), values, strict=True))
 
         except Exception as e:
             logger.debug(f"Error syncing to device from S7 server: {e}")
@@ -305,34 +351,36 @@ class S7TCPServer:
 
     async def read_db(self, db_number: int, start: int, size: int) -> bytes:
         """Read bytes from a Data Block (for testing/attacks)."""
-        if not self._running or db_number not in self._db_buffers:
-            raise RuntimeError(f"S7 server not running or DB{db_number} not available")
+        self._check_db_span(db_number, start, size, "Read")
 
         db_buffer = self._db_buffers[db_number]
-        if start + size > len(db_buffer):
-            raise ValueError(f"Read beyond DB{db_number} bounds")
-
         return bytes(db_buffer[start : start + size])
 
     async def write_db(self, db_number: int, start: int, data: bytes) -> None:
         """Write bytes to a Data Block (for testing/attacks)."""
-        if not self._running or db_number not in self._db_buffers:
-            raise RuntimeError(f"S7 server not running or DB{db_number} not available")
+        self._check_db_span(db_number, start, len(data), "Write")
 
         db_buffer = self._db_buffers[db_number]
-        if start + len(data) > len(db_buffer):
-            raise ValueError(f"Write beyond DB{db_number} bounds")
-
         db_buffer[start : start + len(data)] = data
 
+    def _check_db_span(self, db_number: int, start: int, size: int, op: str) -> None:
+        """Validate a DB access against the configured size, then server state.
+
+        Bounds come from db_sizes, so bad arguments are reported even
+        before the buffers are allocated.
+
+        Raises:
+            RuntimeError: If the DB is unknown or the server is not running
+            ValueError: If the span falls outside the DB
+        """
+        db_size = self.db_sizes.get(db_number)
+        if db_size is None:
+            raise RuntimeError(f"S7 server not running or DB{db_number} not available")
+        if start < 0 or start + size > db_size:
+            raise ValueError(f"{op} beyond DB{db_number} bounds")
+        if not self._running or db_number not in self._db_buffers:
+            raise RuntimeError(f"S7 server not running or DB{db_number} not available")
+
     def get_info(self) -> dict[str, Any]:
         """Get server info."""
-        return {
-            "protocol": "s7",
-            "host": self.host,
-            "port": self.port,
-            "rack": self.rack,
-            "slot": self.slot,
-            "running": self._running,
-            "db_sizes": self.db_sizes,
-        }
+        return {**self._info_base, "running": self._running}
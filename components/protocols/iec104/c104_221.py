@@ -67,9 +67,6 @@ class IEC104C104Adapter:
 
                 self._server.start()
                 self._running = True
-                print(
-                    f"[DEBUG] IEC104 server started on {self.bind_host}:{self.bind_port}"
-                )
                 logger.info(
                     f"IEC104 simulator started on {self.bind_host}:{self.bind_port}"
                 )
@@ -79,11 +76,7 @@ class IEC104C104Adapter:
                     time.sleep(0.1)
 
             except Exception as e:
-                print(f"[DEBUG] IEC104 server start error: {e}")
-                import traceback
-
-                traceback.print_exc()
-                logger.error(f"IEC104 server failed to start: {e}")
+                logger.error(f"IEC104 server failed to start: {e}", exc_info=True)
                 self._running = False
 
         self._stop_event.clear()
@@ -94,7 +87,6 @@ class IEC104C104Adapter:
         await asyncio.sleep(0.3)
 
         if not self._running:
-            print("[DEBUG] IEC104 not running after sleep")
             logger.error(
                 f"IEC104 simulator did not start on {self.bind_host}:{self.bind_port}"
             )
@@ -140,6 +140,20 @@ class DataStore:
             metadata=metadata,
         )
 
+    async def register_devices(self, specs: list[dict[str, Any]]) -> int:
+        """Register several devices in one batch.
+
+        Args:
+            specs: List of register_device() keyword-argument dicts
+
+        Returns:
+            Number of devices that were newly registered
+
+        Raises:
+            ValueError: If any spec is invalid (nothing is registered)
+        """
+        return await self.system_state.register_devices(specs)
+
     async def unregister_device(self, device_name: str) -> bool:
         """Remove a device.
 
@@ -7,6 +7,7 @@ Provides unified interface for monitoring and control.
 """
 
 import asyncio
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
@@ -17,8 +18,13 @@ from components.time.simulation_time import SimulationTime
 # Configure logging
 logger = get_logger(__name__)
 
+# Keys every register_devices() spec must carry (metadata is optional)
+_REQUIRED_SPEC_KEYS = frozenset(
+    {"device_name", "device_type", "device_id", "protocols"}
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class DeviceState:
     """State snapshot for a single device.
 
@@ -43,7 +49,7 @@ class DeviceState:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulationState:
     """Overall simulation state.
 
@@ -62,6 +68,15 @@ class SimulationState:
     total_update_cycles: int = 0
 
 
+def _drop_from_index(index: dict[str, dict[str, Any]], key: str, name: str) -> None:
+    """Remove name from index[key], deleting the key once it is empty."""
+    names = index.get(key)
+    if names is not None:
+        names.pop(name, None)
+        if not names:
+            del index[key]
+
+
 class SystemState:
     """
     Centralised state manager for ICS simulation.
@@ -86,6 +101,13 @@ class SystemState:
         self.devices: dict[str, DeviceState] = {}
         self.simulation = SimulationState()
         self._lock = asyncio.Lock()
+        # Name indexes for get_devices_by_type/protocol, kept in step with
+        # devices. Dicts rather than sets so lookups return devices in
+        # registration order, as a scan of self.devices would. Protocol
+        # entries hold how often the device lists that protocol, which is
+        # what get_summary() counts
+        self._by_type: defaultdict[str, dict[str, None]] = defaultdict(dict)
+        self._by_protocol: defaultdict[str, dict[str, int]] = defaultdict(dict)
         self._sim_time = SimulationTime()
         self.audit_log: list[dict[str, Any]] = []  # Centralised audit trail
 
@@ -116,6 +138,62 @@ class SystemState:
         Raises:
             ValueError: If device_name is empty or invalid
         """
+        self._validate_registration(device_name, device_type, protocols)
+
+        async with self._lock:
+            return self._store_device(
+                device_name, device_type, device_id, protocols, metadata
+            )
+
+    async def register_devices(self, specs: list[dict[str, Any]]) -> int:
+        """Register several devices under a single lock acquisition.
+
+        Each spec holds the keyword arguments of register_device(). All
+        specs are validated before any device is stored, so a bad spec
+        leaves the state untouched.
+
+        Args:
+            specs: List of register_device() keyword-argument dicts
+
+        Returns:
+            Number of devices that were newly registered (not replacements)
+
+        Raises:
+            ValueError: If any spec is invalid
+        """
+        for spec in specs:
+            self._validate_spec_keys(spec)
+            self._validate_registration(
+                spec["device_name"], spec["device_type"], spec["protocols"]
+            )
+
+        async with self._lock:
+            return sum(self._store_device(**spec) for spec in specs)
+
+    @staticmethod
+    def _validate_spec_keys(spec: dict[str, Any]) -> None:
+        """Check a register_devices() spec has exactly register_device()'s keys.
+
+        Raises:
+            ValueError: If a required key is missing or an unknown key is present
+        """
+        missing = _REQUIRED_SPEC_KEYS - spec.keys()
+        if missing:
+            raise ValueError(f"device spec missing keys: {sorted(missing)}")
+
+        unknown = spec.keys() - _REQUIRED_SPEC_KEYS - {"metadata"}
+        if unknown:
+            raise ValueError(f"device spec has unknown keys: {sorted(unknown)}")
+
+    @staticmethod
+    def _validate_registration(
+        device_name: Any, device_type: Any, protocols: Any
+    ) -> None:
+        """Validate register_device() arguments.
+
+        Raises:
+            ValueError: If device_name, device_type or protocols is invalid
+        """
         if not device_name or not isinstance(device_name, str):
             raise ValueError("device_name must be a non-empty string")
 
@@ -127,30 +205,66 @@ class SystemState:
                 "protocols must be a list (can be empty for client devices)"
             )
 
-        async with self._lock:
-            already_exists = device_name in self.devices
-
-            self.devices[device_name] = DeviceState(
-                device_name=device_name,
-                device_type=device_type,
-                device_id=device_id,
-                protocols=protocols,
-                online=False,
-                metadata=metadata or {},
+    def _store_device(
+        self,
+        device_name: str,
+        device_type: str,
+        device_id: int,
+        protocols: list[str],
+        metadata: dict[str, Any] | None = None,
+    ) -> bool:
+        """Create or replace a device entry.
+
+        Note: Should only be called while holding self._lock
+
+        Returns:
+            True if the device is new, False if it replaced an existing entry
+        """
+        previous = self.devices.get(device_name)
+        already_exists = previous is not None
+        if already_exists:
+            # Only drop stale index entries; unchanged ones keep their position
+            if previous.device_type != device_type:
+                _drop_from_index(self._by_type, previous.device_type, device_name)
+            for protocol in set(previous.protocols).difference(protocols):
+                _drop_from_index(self._by_protocol, protocol, device_name)
+
+        self.devices[device_name] = DeviceState(
+            device_name=device_name,
+            device_type=device_type,
+            device_id=device_id,
+            protocols=protocols,
+            online=False,
+            metadata=metadata or {},
+        )
+        self.simulation.total_devices = len(self.devices)
+        self._by_type[device_type][device_name] = None
+        listed: dict[str, int] = {}
+        for protocol in protocols:
+            listed[protocol] = listed.get(protocol, 0) + 1
+        for protocol, times in listed.items():
+            self._by_protocol[protocol][device_name] = times
+
+        if already_exists:
+            logger.warning(
+                f"Device {device_name} already registered, replaced with new configuration"
             )
-            self.simulation.total_devices = len(self.devices)
+        else:
+            logger.info(
+                f"Registered device: {device_name} "
+                f"(type={device_type}, id={device_id}, protocols={protocols})"
+            )
+
+        return not already_exists
 
-            if already_exists:
-                logger.warning(
-                    f"Device {device_name} already registered, replaced with new configuration"
-                )
-            else:
-                logger.info(
-                    f"Registered device: {device_name} "
-                    f"(type={device_type}, id={device_id}, protocols={protocols})"
-                )
+    def _unindex_device(self, device: DeviceState) -> None:
+        """Drop a device from the type and protocol indexes.
 
-            return not already_exists
+        Note: Should only be called while holding self._lock
+        """
+        _drop_from_index(self._by_type, device.device_type, device.device_name)
+        for protocol in device.protocols:
+            _drop_from_index(self._by_protocol, protocol, device.device_name)
 
     async def unregister_device(self, device_name: str) -> bool:
         """Remove a device from state tracking.
@@ -170,6 +284,7 @@ class SystemState:
             was_online = device.online
 
             del self.devices[device_name]
+            self._unindex_device(device)
             self.simulation.total_devices = len(self.devices)
 
             if was_online:
@@ -273,7 +388,7 @@ class SystemState:
             List of matching devices
         """
         async with self._lock:
-            return [d for d in self.devices.values() if d.device_type == device_type]
+            return [self.devices[name] for name in self._by_type.get(device_type, ())]
 
     async def get_devices_by_protocol(self, protocol: str) -> list[DeviceState]:
         """Get all devices supporting a specific protocol.
@@ -285,7 +400,7 @@ class SystemState:
             List of devices supporting the protocol
         """
         async with self._lock:
-            return [d for d in self.devices.values() if protocol in d.protocols]
+            return [self.devices[name] for name in self._by_protocol.get(protocol, ())]
 
     async def get_simulation_state(self) -> SimulationState:
         """Get overall simulation state.
@@ -335,10 +450,7 @@ class SystemState:
         Returns:
             Dictionary mapping device types to counts
         """
-        counts: dict[str, int] = {}
-        for device in self.devices.values():
-            counts[device.device_type] = counts.get(device.device_type, 0) + 1
-        return counts
+        return {t: len(names) for t, names in self._by_type.items()}
 
     def _count_protocols(self) -> dict[str, int]:
         """Count protocol usage across devices.
@@ -348,11 +460,7 @@ class SystemState:
         Returns:
             Dictionary mapping protocols to usage counts
         """
-        counts: dict[str, int] = {}
-        for device in self.devices.values():
-            for protocol in device.protocols:
-                counts[protocol] = counts.get(protocol, 0) + 1
-        return counts
+        return {p: sum(names.values()) for p, names in self._by_protocol.items()}
 
     # ----------------------------------------------------------------
     # Lifecycle
@@ -382,6 +490,8 @@ class SystemState:
         async with self._lock:
             device_count = len(self.devices)
             self.devices.clear()
+            self._by_type.clear()
+            self._by_protocol.clear()
             self.simulation = SimulationState()
             self.audit_log.clear()  # Clear audit log on reset
             logger.info(f"System state reset: cleared {device_count} devices")
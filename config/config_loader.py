@@ -3,10 +3,37 @@
 Config loader module for modular YAML configuration.
 """
 
+import pickle
+from functools import cache
 from pathlib import Path
 
 import yaml
 
+# Use libyaml's C parser/emitter when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader  # type: ignore[assignment]
+
+
+# Last parse of each YAML file, keyed on its bytes and stored pickled:
+# load_all() re-reads the same files many times per run, and a byte compare
+# plus unpickle is far cheaper than re-parsing (and yields a fresh copy)
+_parsed_cache: dict[Path, tuple[bytes, bytes]] = {}
+
+
+def _load_yaml(path):
+    """Load a YAML file, reusing the last parse while its content is unchanged."""
+    raw = path.read_bytes()
+    cached = _parsed_cache.get(path)
+    if cached is not None and cached[0] == raw:
+        return pickle.loads(cached[1])
+
+    data = yaml.load(raw, Loader=SafeLoader)
+    _parsed_cache[path] = (raw, pickle.dumps(data, pickle.HIGHEST_PROTOCOL))
+    return data
+
 
 class ConfigLoader:
     """Loads and merges modular configuration files."""
@@ -22,26 +49,22 @@ class ConfigLoader:
         # Load devices config
         devices_path = self.config_dir / "devices.yml"
         if devices_path.exists():
-            with open(devices_path) as f:
-                devices_data = yaml.safe_load(f)
-                config["devices"] = devices_data.get("devices", [])
+            devices_data = _load_yaml(devices_path)
+            config["devices"] = devices_data.get("devices", [])
         else:
             config["devices"] = self._create_default_devices()
-            self._save_devices(config["devices"])
+            self._write_devices_yaml(_default_devices_yaml())
 
         # Load network config
         network_path = self.config_dir / "network.yml"
         if network_path.exists():
-            with open(network_path) as f:
-                network_data = yaml.safe_load(f)
-                config["segmentation"] = network_data.get("segmentation", {})
-                config["zones"] = network_data.get("zones", [])
-                config["networks"] = network_data.get("networks", [])
-                config["connections"] = network_data.get("connections", {})
-                config["inter_zone_routing"] = network_data.get(
-                    "inter_zone_routing", []
-                )
-                config["physical_topology"] = network_data.get("physical_topology", {})
+            network_data = _load_yaml(network_path)
+            config["segmentation"] = network_data.get("segmentation", {})
+            config["zones"] = network_data.get("zones", [])
+            config["networks"] = network_data.get("networks", [])
+            config["connections"] = network_data.get("connections", {})
+            config["inter_zone_routing"] = network_data.get("inter_zone_routing", [])
+            config["physical_topology"] = network_data.get("physical_topology", {})
         else:
             config["segmentation"] = {}
             config["zones"] = []
@@ -51,10 +74,9 @@ class ConfigLoader:
         # Load protocols config
         protocols_path = self.config_dir / "protocols.yml"
         if protocols_path.exists():
-            with open(protocols_path) as f:
-                protocols_data = yaml.safe_load(f)
-                config["protocol_settings"] = protocols_data.get("protocols", {})
-                config["adapter_info"] = protocols_data.get("adapters", {})
+            protocols_data = _load_yaml(protocols_path)
+            config["protocol_settings"] = protocols_data.get("protocols", {})
+            config["adapter_info"] = protocols_data.get("adapters", {})
         else:
             config["protocol_settings"] = {}
             config["adapter_info"] = {}
@@ -62,48 +84,43 @@ class ConfigLoader:
         # Load simulation config
         simulation_path = self.config_dir / "simulation.yml"
         if simulation_path.exists():
-            with open(simulation_path) as f:
-                simulation_data = yaml.safe_load(f)
-                config["simulation"] = simulation_data.get("simulation", {})
+            simulation_data = _load_yaml(simulation_path)
+            config["simulation"] = simulation_data.get("simulation", {})
         else:
             config["simulation"] = {}
 
         # Load SCADA tags config
         scada_tags_path = self.config_dir / "scada_tags.yml"
         if scada_tags_path.exists():
-            with open(scada_tags_path) as f:
-                scada_data = yaml.safe_load(f)
-                config["scada_servers"] = scada_data.get("scada_servers", {})
+            scada_data = _load_yaml(scada_tags_path)
+            config["scada_servers"] = scada_data.get("scada_servers", {})
         else:
             config["scada_servers"] = {}
 
         # Load HMI screens config
         hmi_screens_path = self.config_dir / "hmi_screens.yml"
         if hmi_screens_path.exists():
-            with open(hmi_screens_path) as f:
-                hmi_data = yaml.safe_load(f)
-                config["hmi_workstations"] = hmi_data.get("hmi_workstations", {})
+            hmi_data = _load_yaml(hmi_screens_path)
+            config["hmi_workstations"] = hmi_data.get("hmi_workstations", {})
         else:
             config["hmi_workstations"] = {}
 
         # Load device identity config
         device_identity_path = self.config_dir / "device_identity.yml"
         if device_identity_path.exists():
-            with open(device_identity_path) as f:
-                identity_data = yaml.safe_load(f)
-                config["device_identities"] = identity_data.get("device_identities", {})
+            identity_data = _load_yaml(device_identity_path)
+            config["device_identities"] = identity_data.get("device_identities", {})
         else:
             config["device_identities"] = {}
 
         # Load firewall config
         firewall_path = self.config_dir / "firewall.yml"
         if firewall_path.exists():
-            with open(firewall_path) as f:
-                firewall_data = yaml.safe_load(f)
-                config["firewall"] = {
-                    "default_action": firewall_data.get("default_action", "allow"),
-                    "baseline_rules": firewall_data.get("baseline_rules", []),
-                }
+            firewall_data = _load_yaml(firewall_path)
+            config["firewall"] = {
+                "default_action": firewall_data.get("default_action", "allow"),
+                "baseline_rules": firewall_data.get("baseline_rules", []),
+            }
         else:
             config["firewall"] = {
                 "default_action": "allow",
@@ -113,16 +130,13 @@ class ConfigLoader:
         # Load IDS/IPS config
         ids_ips_path = self.config_dir / "ids_ips.yml"
         if ids_ips_path.exists():
-            with open(ids_ips_path) as f:
-                ids_data = yaml.safe_load(f)
-                config["ids_ips"] = {
-                    "prevention_mode": ids_data.get("prevention_mode", False),
-                    "auto_block_on_critical": ids_data.get(
-                        "auto_block_on_critical", True
-                    ),
-                    "permanent_blocked_ips": ids_data.get("permanent_blocked_ips", []),
-                    "detection_thresholds": ids_data.get("detection_thresholds", {}),
-                }
+            ids_data = _load_yaml(ids_ips_path)
+            config["ids_ips"] = {
+                "prevention_mode": ids_data.get("prevention_mode", False),
+                "auto_block_on_critical": ids_data.get("auto_block_on_critical", True),
+                "permanent_blocked_ips": ids_data.get("permanent_blocked_ips", []),
+                "detection_thresholds": ids_data.get("detection_thresholds", {}),
+            }
         else:
             config["ids_ips"] = {
                 "prevention_mode": False,
@@ -133,15 +147,14 @@ class ConfigLoader:
         # Load RBAC config
         rbac_path = self.config_dir / "rbac.yml"
         if rbac_path.exists():
-            with open(rbac_path) as f:
-                rbac_data = yaml.safe_load(f)
-                config["rbac"] = {
-                    "enforcement_enabled": rbac_data.get("enforcement_enabled", False),
-                    "log_denials": rbac_data.get("log_denials", True),
-                    "require_session": rbac_data.get("require_session", True),
-                    "address_permissions": rbac_data.get("address_permissions", {}),
-                    "default_users": rbac_data.get("default_users", []),
-                }
+            rbac_data = _load_yaml(rbac_path)
+            config["rbac"] = {
+                "enforcement_enabled": rbac_data.get("enforcement_enabled", False),
+                "log_denials": rbac_data.get("log_denials", True),
+                "require_session": rbac_data.get("require_session", True),
+                "address_permissions": rbac_data.get("address_permissions", {}),
+                "default_users": rbac_data.get("default_users", []),
+            }
         else:
             config["rbac"] = {
                 "enforcement_enabled": False,
@@ -154,22 +167,15 @@ class ConfigLoader:
         # Load Modbus filtering config
         modbus_filtering_path = self.config_dir / "modbus_filtering.yml"
         if modbus_filtering_path.exists():
-            with open(modbus_filtering_path) as f:
-                modbus_data = yaml.safe_load(f)
-                config["modbus_filtering"] = {
-                    "enforcement_enabled": modbus_data.get(
-                        "enforcement_enabled", False
-                    ),
-                    "global_policy": modbus_data.get("global_policy", {}),
-                    "device_policies": modbus_data.get("device_policies", []),
-                    "log_blocked_requests": modbus_data.get(
-                        "log_blocked_requests", True
-                    ),
-                    "log_allowed_requests": modbus_data.get(
-                        "log_allowed_requests", False
-                    ),
-                    "block_mode": modbus_data.get("block_mode", "reject"),
-                }
+            modbus_data = _load_yaml(modbus_filtering_path)
+            config["modbus_filtering"] = {
+                "enforcement_enabled": modbus_data.get("enforcement_enabled", False),
+                "global_policy": modbus_data.get("global_policy", {}),
+                "device_policies": modbus_data.get("device_policies", []),
+                "log_blocked_requests": modbus_data.get("log_blocked_requests", True),
+                "log_allowed_requests": modbus_data.get("log_allowed_requests", False),
+                "block_mode": modbus_data.get("block_mode", "reject"),
+            }
         else:
             config["modbus_filtering"] = {
                 "enforcement_enabled": False,
@@ -187,22 +193,19 @@ class ConfigLoader:
         # Load anomaly detection config
         anomaly_detection_path = self.config_dir / "anomaly_detection.yml"
         if anomaly_detection_path.exists():
-            with open(anomaly_detection_path) as f:
-                anomaly_data = yaml.safe_load(f)
-                config["anomaly_detection"] = {
-                    "enabled": anomaly_data.get("enabled", False),
-                    "sigma_threshold": anomaly_data.get("sigma_threshold", 3.0),
-                    "learning_window": anomaly_data.get("learning_window", 1000),
-                    "alarm_flood_threshold": anomaly_data.get(
-                        "alarm_flood_threshold", 10
-                    ),
-                    "alarm_flood_window": anomaly_data.get("alarm_flood_window", 60.0),
-                    "baselines": anomaly_data.get("baselines", []),
-                    "range_limits": anomaly_data.get("range_limits", []),
-                    "rate_limits": anomaly_data.get("rate_limits", []),
-                    "severity_mapping": anomaly_data.get("severity_mapping", {}),
-                    "integration": anomaly_data.get("integration", {}),
-                }
+            anomaly_data = _load_yaml(anomaly_detection_path)
+            config["anomaly_detection"] = {
+                "enabled": anomaly_data.get("enabled", False),
+                "sigma_threshold": anomaly_data.get("sigma_threshold", 3.0),
+                "learning_window": anomaly_data.get("learning_window", 1000),
+                "alarm_flood_threshold": anomaly_data.get("alarm_flood_threshold", 10),
+                "alarm_flood_window": anomaly_data.get("alarm_flood_window", 60.0),
+                "baselines": anomaly_data.get("baselines", []),
+                "range_limits": anomaly_data.get("range_limits", []),
+                "rate_limits": anomaly_data.get("rate_limits", []),
+                "severity_mapping": anomaly_data.get("severity_mapping", {}),
+                "integration": anomaly_data.get("integration", {}),
+            }
         else:
             config["anomaly_detection"] = {
                 "enabled": False,
@@ -220,22 +223,21 @@ class ConfigLoader:
         # Load OPC UA security config
         opcua_security_path = self.config_dir / "opcua_security.yml"
         if opcua_security_path.exists():
-            with open(opcua_security_path) as f:
-                opcua_data = yaml.safe_load(f)
-                config["opcua_security"] = {
-                    "enforcement_enabled": opcua_data.get("enforcement_enabled", False),
-                    "security_policy": opcua_data.get(
-                        "security_policy", "Aes256_Sha256_RsaPss"
-                    ),
-                    "cert_dir": opcua_data.get("cert_dir", "certs"),
-                    "validity_hours": opcua_data.get("validity_hours", 8760),
-                    "key_size": opcua_data.get("key_size", 2048),
-                    "allow_anonymous": opcua_data.get("allow_anonymous", False),
-                    "require_authentication": opcua_data.get(
-                        "require_authentication", False
-                    ),
-                    "server_overrides": opcua_data.get("server_overrides", {}),
-                }
+            opcua_data = _load_yaml(opcua_security_path)
+            config["opcua_security"] = {
+                "enforcement_enabled": opcua_data.get("enforcement_enabled", False),
+                "security_policy": opcua_data.get(
+                    "security_policy", "Aes256_Sha256_RsaPss"
+                ),
+                "cert_dir": opcua_data.get("cert_dir", "certs"),
+                "validity_hours": opcua_data.get("validity_hours", 8760),
+                "key_size": opcua_data.get("key_size", 2048),
+                "allow_anonymous": opcua_data.get("allow_anonymous", False),
+                "require_authentication": opcua_data.get(
+                    "require_authentication", False
+                ),
+                "server_overrides": opcua_data.get("server_overrides", {}),
+            }
         else:
             config["opcua_security"] = {
                 "enforcement_enabled": False,
@@ -250,7 +252,8 @@ class ConfigLoader:
 
         return config
 
-    def _create_default_devices(self):
+    @staticmethod
+    def _create_default_devices():
         """Create default device configuration."""
         return [
             {
@@ -302,7 +305,21 @@ class ConfigLoader:
 
     def _save_devices(self, devices):
         """Save devices configuration to file."""
+        self._write_devices_yaml(_dump_devices(devices))
+
+    def _write_devices_yaml(self, text):
+        """Write serialised devices configuration to devices.yml."""
         devices_path = self.config_dir / "devices.yml"
-        with open(devices_path, "w") as f:
-            yaml.dump({"devices": devices}, f, default_flow_style=False)
+        devices_path.write_text(text)
         print(f"[INFO] Created default devices config at {devices_path}")
+
+
+def _dump_devices(devices):
+    """Serialise a devices list in the devices.yml layout."""
+    return yaml.dump({"devices": devices}, Dumper=SafeDumper, default_flow_style=False)
+
+
+@cache
+def _default_devices_yaml():
+    """devices.yml text for the default devices, serialised once per process."""
+    return _dump_devices(ConfigLoader._create_default_devices())
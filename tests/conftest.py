@@ -14,31 +14,13 @@ from pathlib import Path
 import pytest
 import yaml
 
-
 # ----------------------------------------------------------------
 # Async event loop configuration
 # ----------------------------------------------------------------
-@pytest.fixture(scope="session")
-def event_loop_policy():
-    """Set event loop policy for the test session."""
-    return asyncio.get_event_loop_policy()
-
-
-@pytest.fixture
-def event_loop(event_loop_policy):
-    """Create an event loop for each test.
-
-    This ensures each test gets a fresh event loop and proper cleanup.
-    """
-    loop = event_loop_policy.new_event_loop()
-    yield loop
-    # Cancel all pending tasks
-    pending = asyncio.all_tasks(loop)
-    for task in pending:
-        task.cancel()
-    # Run loop until all tasks are cancelled
-    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
-    loop.close()
+# One event loop is shared by the whole session. Loop scope is set via
+# asyncio_default_fixture_loop_scope / asyncio_default_test_loop_scope
+# in pyproject.toml; pytest-asyncio >= 0.23 ignores an ``event_loop``
+# fixture override, so none is defined here.
 
 
 # ----------------------------------------------------------------
@@ -27,3 +27,49 @@ def test_save_and_load_devices(tmp_path):
         data = yaml.safe_load(f)
     assert "devices" in data
     assert len(data["devices"]) == len(devices)
+
+
+def test_uses_libyaml_when_available():
+    from config import config_loader
+
+    if yaml.__with_libyaml__:
+        assert config_loader.SafeLoader is yaml.CSafeLoader
+        assert config_loader.SafeDumper is yaml.CSafeDumper
+    else:
+        assert config_loader.SafeLoader is yaml.SafeLoader
+        assert config_loader.SafeDumper is yaml.SafeDumper
+
+
+def test_default_devices_file_matches_dump(tmp_path):
+    loader = ConfigLoader(config_dir=tmp_path)
+    loader.load_all()
+
+    written = (tmp_path / "devices.yml").read_text()
+    data = yaml.safe_load(written)
+    assert data == {"devices": loader._create_default_devices()}
+
+
+def test_load_all_reuses_parse_until_file_changes(tmp_path, monkeypatch):
+    from config import config_loader
+
+    (tmp_path / "simulation.yml").write_text("simulation:\n  runtime: {}\n")
+    loader = ConfigLoader(config_dir=tmp_path)
+    loader._save_devices([])
+    loader.load_all()
+
+    parses = []
+    real_load = yaml.load
+    monkeypatch.setattr(
+        config_loader.yaml,
+        "load",
+        lambda *a, **kw: parses.append(a) or real_load(*a, **kw),
+    )
+
+    first = loader.load_all()
+    first["simulation"]["runtime"]["mutated"] = True
+    assert parses == []
+    assert loader.load_all()["simulation"] == {"runtime": {}}
+
+    (tmp_path / "simulation.yml").write_text("simulation:\n  runtime: {a: 1}\n")
+    assert loader.load_all()["simulation"] == {"runtime": {"a": 1}}
+    assert len(parses) == 1
@@ -112,6 +112,28 @@ class TestNetworkSimulatorConfiguration:
         assert "plc_1" in net_sim.device_networks
         assert "plc_2" in net_sim.device_networks  # Still loads, warns
 
+    async def test_from_dict_loads_without_files(self):
+        """Test building the topology from a pre-parsed config.
+
+        WHY: Callers holding a parsed config should not re-read YAML.
+        """
+        config = {
+            "zones": [
+                {
+                    "name": "control_zone",
+                    "networks": [{"name": "control_network", "vlan": 100}],
+                }
+            ],
+            "connections": {"control_network": ["plc_1"]},
+        }
+
+        net_sim = NetworkSimulator.from_dict(config)
+        await net_sim.load()
+
+        assert net_sim.device_networks == {"plc_1": {"control_network"}}
+        assert net_sim.network_to_zone == {"control_network": "control_zone"}
+        assert "zone" not in config["zones"][0]["networks"][0]  # Not mutated
+
 
 # ================================================================
 # SERVICE EXPOSURE TESTS
@@ -16,62 +16,42 @@ import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-import yaml
 
 from components.network.network_simulator import NetworkSimulator
 from components.network.protocol_simulator import ProtocolHandler, ProtocolSimulator
-from config.config_loader import ConfigLoader
-
 
 # ================================================================
 # FIXTURES
 # ================================================================
-@pytest.fixture
-def simple_network_config(temp_config_dir):
-    """Create simple network configuration."""
-    config = {
-        "networks": [{"name": "control_network", "vlan": 100}],
-        "connections": {"control_network": ["plc_1", "plc_2"]},
-    }
-
-    (temp_config_dir / "network.yml").write_text(yaml.dump(config))
-    (temp_config_dir / "devices.yml").write_text(yaml.dump({"devices": []}))
-
-    return ConfigLoader(config_dir=str(temp_config_dir))
+SIMPLE_NETWORK_CFG = {
+    "networks": [{"name": "control_network", "vlan": 100}],
+    "connections": {"control_network": ["plc_1", "plc_2"]},
+}
+
+SEGMENTED_NETWORK_CFG = {
+    "networks": [
+        {"name": "control_network", "vlan": 100},
+        {"name": "corporate_network", "vlan": 200},
+    ],
+    "connections": {
+        "control_network": ["plc_1", "scada_1"],
+        "corporate_network": ["workstation_1"],
+    },
+}
 
 
 @pytest.fixture
-def segmented_network_config(temp_config_dir):
-    """Create segmented network configuration."""
-    config = {
-        "networks": [
-            {"name": "control_network", "vlan": 100},
-            {"name": "corporate_network", "vlan": 200},
-        ],
-        "connections": {
-            "control_network": ["plc_1", "scada_1"],
-            "corporate_network": ["workstation_1"],
-        },
-    }
-
-    (temp_config_dir / "network.yml").write_text(yaml.dump(config))
-    (temp_config_dir / "devices.yml").write_text(yaml.dump({"devices": []}))
-
-    return ConfigLoader(config_dir=str(temp_config_dir))
-
-
-@pytest.fixture
-async def network_sim(simple_network_config):
+async def network_sim():
     """Create loaded NetworkSimulator."""
-    net_sim = NetworkSimulator(config_loader=simple_network_config)
+    net_sim = NetworkSimulator.from_dict(SIMPLE_NETWORK_CFG)
     await net_sim.load()
     return net_sim
 
 
 @pytest.fixture
-async def segmented_network_sim(segmented_network_config):
+async def segmented_network_sim():
     """Create loaded segmented NetworkSimulator."""
-    net_sim = NetworkSimulator(config_loader=segmented_network_config)
+    net_sim = NetworkSimulator.from_dict(SEGMENTED_NETWORK_CFG)
     await net_sim.load()
     return net_sim
 
@@ -417,6 +397,7 @@ class TestListenerConnectionHandling:
     """Test _Listener connection handling."""
 
     @pytest.mark.asyncio
+    @pytest.mark.slow
     async def test_listener_tracks_connection_counts(
         self, network_sim, mock_handler_factory
     ):
@@ -512,6 +493,7 @@ class TestProtocolSimulatorNetworkEnforcement:
         """
         proto_sim = ProtocolSimulator(network_sim)
 
+        # Registration exposes the service; no listener socket is needed
         await proto_sim.register(
             node="plc_1",
             network="control_network",
@@ -520,19 +502,43 @@ class TestProtocolSimulatorNetworkEnforcement:
             handler_factory=mock_handler_factory,
         )
 
-        await proto_sim.start()
+        can_reach = await network_sim.can_reach(
+            "control_network", "plc_1", "modbus", 15505
+        )
+        assert can_reach is True
 
-        try:
-            # Connect from localhost (maps to plant_network, but plc_1 is on control_network)
-            # This will be denied because plant_network != control_network
-            # Let's check the reachability first
-            can_reach = await network_sim.can_reach(
-                "control_network", "plc_1", "modbus", 15505
-            )
-            assert can_reach is True
+    @pytest.mark.asyncio
+    async def test_connection_denied_by_segmentation(
+        self, network_sim, mock_handler_factory, monkeypatch
+    ):
+        """Test listener drops connections the network sim rejects.
 
-        finally:
-            await proto_sim.stop()
+        WHY: Enforcement lives in the listener - exercise it without sockets.
+        """
+        proto_sim = ProtocolSimulator(network_sim)
+        await proto_sim.register(
+            node="plc_1",
+            network="control_network",
+            port=15505,
+            protocol="modbus",
+            handler_factory=mock_handler_factory,
+        )
+        listener = proto_sim.listeners[0]
+
+        can_reach = AsyncMock(return_value=False)
+        monkeypatch.setattr(network_sim, "can_reach", can_reach)
+        monkeypatch.setattr(listener.logger, "log_security", AsyncMock())
+
+        writer = MagicMock()
+        writer.get_extra_info.return_value = ("127.0.0.1", 50000)
+        writer.wait_closed = AsyncMock()
+
+        await listener._handle_connection(MagicMock(), writer)
+
+        can_reach.assert_awaited_once_with("plant_network", "plc_1", "modbus", 15505)
+        assert listener.total_connections == 1
+        assert listener.denied_connections == 1
+        writer.close.assert_called_once()
 
 
 # ================================================================
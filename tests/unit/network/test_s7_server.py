@@ -6,6 +6,7 @@ Tests the S7 protocol server that opens real network ports
 for ICS attack demonstrations.
 """
 
+import sys
 from ctypes import c_uint8
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
@@ -18,53 +19,72 @@ snap7_mock.SrvArea.DB = 0x84  # Typical S7 DB area code
 snap7_mock.server = MagicMock()
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(autouse=True, scope="module")
 def mock_snap7():
-    """Mock snap7 library for all tests."""
-    with patch.dict(
-        "sys.modules",
-        {
-            "snap7": snap7_mock,
-            "snap7.server": snap7_mock.server,
-            "snap7.util": snap7_mock.util,
-        },
-    ):
-        # Setup utility functions
-        snap7_mock.util.get_bool = Mock(return_value=True)
-        snap7_mock.util.set_bool = Mock()
-        snap7_mock.util.get_int = Mock(return_value=42)
-        snap7_mock.util.set_int = Mock()
-
-        # Make SNAP7_AVAILABLE true
-        with (
-            patch("components.network.servers.s7_server.SNAP7_AVAILABLE", True),
-            patch(
-                "components.network.servers.s7_server.Snap7Server",
-                snap7_mock.server.Server,
-            ),
-            patch("components.network.servers.s7_server.SrvArea", snap7_mock.SrvArea),
-            patch("components.network.servers.s7_server.c_uint8", c_uint8),
-            patch(
-                "components.network.servers.s7_server.get_bool",
-                snap7_mock.util.get_bool,
-            ),
-            patch(
-                "components.network.servers.s7_server.set_bool",
-                snap7_mock.util.set_bool,
-            ),
-            patch(
-                "components.network.servers.s7_server.get_int", snap7_mock.util.get_int
-            ),
-            patch(
-                "components.network.servers.s7_server.set_int", snap7_mock.util.set_int
-            ),
-        ):
-            yield snap7_mock
+    """Mock snap7 library once for the whole module."""
+    import components.network.servers.s7_server as s7mod
+
+    # Module scope rules out the monkeypatch fixture; one context still
+    # undoes every setattr in a single sweep
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(sys.modules, "snap7", snap7_mock)
+        mp.setitem(sys.modules, "snap7.server", snap7_mock.server)
+        mp.setattr(s7mod, "SNAP7_AVAILABLE", True)
+        mp.setattr(s7mod, "Snap7Server", snap7_mock.server.Server)
+        mp.setattr(s7mod, "SrvArea", snap7_mock.SrvArea)
+        mp.setattr(s7mod, "c_uint8", c_uint8)
+        yield snap7_mock
 
 
 from components.network.servers.s7_server import S7TCPServer  # noqa: E402
 
 
+def _started_server_instance():
+    """Build a snap7 server mock that reports itself running."""
+    return Mock(
+        start=Mock(),
+        get_status=Mock(return_value=1),
+        register_area=Mock(),
+        stop=Mock(),
+    )
+
+
+@pytest.fixture
+def mock_started_server_instance(mock_snap7):
+    """Make S7TCPServer.start() succeed against a mocked snap7 server."""
+    instance = _started_server_instance()
+    server_class = Mock(return_value=instance)
+    mock_snap7.server.Server = server_class
+    with patch("components.network.servers.s7_server.Snap7Server", server_class):
+        yield instance
+
+
+@pytest.fixture(scope="module")
+async def _module_s7_server():
+    """Start one S7TCPServer per module against a mocked snap7 server."""
+    with patch.multiple(
+        "components.network.servers.s7_server",
+        SNAP7_AVAILABLE=True,
+        Snap7Server=Mock(return_value=_started_server_instance()),
+        SrvArea=snap7_mock.SrvArea,
+        c_uint8=c_uint8,
+    ):
+        server = S7TCPServer()
+        await server.start()
+
+    yield server
+
+    await server.stop()
+
+
+@pytest.fixture
+def started_s7_server(_module_s7_server):
+    """Running S7TCPServer shared across the module, with zeroed DBs."""
+    for db_buffer in _module_s7_server._db_buffers.values():
+        db_buffer[:] = bytes(len(db_buffer))
+    return _module_s7_server
+
+
 # ================================================================
 # INITIALIZATION TESTS
 # ================================================================
@@ -121,7 +141,6 @@ class TestS7TCPServerInitialization:
 class TestS7TCPServerLifecycle:
     """Test S7TCPServer start/stop lifecycle."""
 
-    @pytest.mark.asyncio
     async def test_start_success(self, mock_snap7):
         """Test successful server start.
 
@@ -133,13 +152,12 @@ class TestS7TCPServerLifecycle:
         with patch.object(server, "_server", Mock(get_status=Mock(return_value=1))):
             # Manually set up what start() would do
             server._running = True
-            server._db_buffers = {i: (c_uint8 * 256)() for i in range(1, 5)}
+            server._db_buffers = {i: bytearray(256) for i in range(1, 5)}
 
             # Verify the server appears started
             assert server.running is True
             assert len(server._db_buffers) == 4
 
-    @pytest.mark.asyncio
     async def test_start_when_already_running(self, mock_snap7):
         """Test starting when already running.
 
@@ -157,28 +175,27 @@ class TestS7TCPServerLifecycle:
         assert result is True
         assert server.running is True
 
-    @pytest.mark.asyncio
-    async def test_start_allocates_db_buffers(self, mock_snap7):
+    async def test_start_allocates_db_buffers(self, mock_started_server_instance):
         """Test that start allocates Data Block buffers.
 
-        WHY: snap7 requires ctypes arrays for memory regions.
+        WHY: snap7 needs backing memory for every registered DB.
         """
-        mock_server_instance = Mock()
-        mock_server_instance.start = Mock()
-        mock_server_instance.get_status = Mock(return_value=1)
-        mock_server_instance.register_area = Mock()
-        mock_snap7.server.Server = Mock(return_value=mock_server_instance)
-
         server = S7TCPServer(db1_size=100, db2_size=200)
         await server.start()
 
-        # Check buffers allocated
-        assert 1 in server._db_buffers
-        assert 2 in server._db_buffers
-        assert len(server._db_buffers[1]) == 100
-        assert len(server._db_buffers[2]) == 200
+        assert server.db_sizes == {1: 100, 2: 200, 3: 64, 4: 64}
+        assert {n: len(buf) for n, buf in server._db_buffers.items()} == server.db_sizes
+
+    async def test_ctypes_view_shares_db_memory(self, started_s7_server):
+        """Test the view registered with snap7 aliases the DB bytearray.
+
+        WHY: Writes from S7 clients must be visible to sync_to_device.
+        """
+        view = started_s7_server._ctypes_view(2)
+        view[0] = 0x5A
+
+        assert started_s7_server._db_buffers[2][0] == 0x5A
 
-    @pytest.mark.asyncio
     async def test_start_registers_data_blocks(self, mock_snap7):
         """Test that start registers all Data Blocks with snap7.
 
@@ -187,25 +204,13 @@ class TestS7TCPServerLifecycle:
         server = S7TCPServer()
 
         # Verify DB configuration exists
-        assert len(server.db_sizes) == 4
-        assert 1 in server.db_sizes
-        assert 2 in server.db_sizes
-        assert 3 in server.db_sizes
-        assert 4 in server.db_sizes
-
-    @pytest.mark.asyncio
-    async def test_stop_when_running(self, mock_snap7):
+        assert server.db_sizes == {1: 256, 2: 256, 3: 64, 4: 64}
+
+    async def test_stop_when_running(self, mock_started_server_instance):
         """Test stopping running server.
 
         WHY: Must cleanly shut down and release port.
         """
-        mock_server_instance = Mock()
-        mock_server_instance.start = Mock()
-        mock_server_instance.get_status = Mock(return_value=1)
-        mock_server_instance.stop = Mock()
-        mock_server_instance.register_area = Mock()
-        mock_snap7.server.Server = Mock(return_value=mock_server_instance)
-
         server = S7TCPServer()
         await server.start()
         await server.stop()
@@ -214,7 +219,6 @@ class TestS7TCPServerLifecycle:
         assert server._server is None
         assert len(server._db_buffers) == 0
 
-    @pytest.mark.asyncio
     async def test_stop_when_not_running(self, mock_snap7):
         """Test stopping when not running.
 
@@ -232,51 +236,76 @@ class TestS7TCPServerLifecycle:
 class TestS7TCPServerDeviceSync:
     """Test device synchronization methods."""
 
-    @pytest.mark.asyncio
-    async def test_sync_from_device_input_registers(self, mock_snap7):
-        """Test syncing input registers from device to server.
+    @pytest.mark.parametrize(
+        "register_type, device_registers, db_num, expected",
+        [
+            # Telemetry from PLC device must appear in S7 server (DB1)
+            (
+                "input_registers",
+                {0: 100, 1: 200, 2: 300},
+                1,
+                b"\x00\x64\x00\xc8\x01\x2c",
+            ),
+            # Digital I/O telemetry must appear in S7 server (DB3)
+            ("discrete_inputs", {0: True, 1: False, 8: True}, 3, b"\x01\x01"),
+        ],
+    )
+    async def test_sync_from_device(
+        self, started_s7_server, register_type, device_registers, db_num, expected
+    ):
+        """Test syncing device values into the server DBs.
 
-        WHY: Telemetry from PLC device must appear in S7 server (DB1).
+        WHY: Device telemetry must be visible to S7 clients.
         """
-        mock_server_instance = Mock()
-        mock_server_instance.start = Mock()
-        mock_server_instance.get_status = Mock(return_value=1)
-        mock_server_instance.register_area = Mock()
-        mock_snap7.server.Server = Mock(return_value=mock_server_instance)
+        await started_s7_server.sync_from_device(device_registers, register_type)
 
-        server = S7TCPServer()
-        await server.start()
+        assert started_s7_server._db_buffers[db_num][: len(expected)] == expected
 
-        # Sync input registers
-        device_registers = {0: 100, 1: 200, 2: 300}
-        await server.sync_from_device(device_registers, "input_registers")
+    async def test_sync_from_device_sparse_and_negative_registers(
+        self, started_s7_server
+    ):
+        """Test non-contiguous addresses and signed values land correctly.
 
-        # Check set_int was called for each register
-        assert mock_snap7.util.set_int.call_count >= 3
+        WHY: Device register maps are often sparse; set_int semantics are signed.
+        """
+        await started_s7_server.sync_from_device({0: -1, 3: 7}, "input_registers")
 
-    @pytest.mark.asyncio
-    async def test_sync_from_device_discrete_inputs(self, mock_snap7):
-        """Test syncing discrete inputs from device to server.
+        assert (
+            started_s7_server._db_buffers[1][:8] == b"\xff\xff\x00\x00\x00\x00\x00\x07"
+        )
+
+    async def test_sync_from_device_clears_discrete_input(self, started_s7_server):
+        """Test a False value clears a previously set bit.
 
-        WHY: Digital I/O telemetry must appear in S7 server (DB3).
+        WHY: Digital inputs must follow the device in both directions.
         """
-        mock_server_instance = Mock()
-        mock_server_instance.start = Mock()
-        mock_server_instance.get_status = Mock(return_value=1)
-        mock_server_instance.register_area = Mock()
-        mock_snap7.server.Server = Mock(return_value=mock_server_instance)
+        started_s7_server._db_buffers[3][0] = 0xFF
 
-        server = S7TCPServer()
-        await server.start()
+        await started_s7_server.sync_from_device({2: False}, "discrete_inputs")
 
-        # Sync discrete inputs
-        device_registers = {0: True, 1: False, 8: True}
-        await server.sync_from_device(device_registers, "discrete_inputs")
+        assert started_s7_server._db_buffers[3][0] == 0xFB
 
-        # Check set_bool was called
-        assert mock_snap7.util.set_bool.call_count >= 3
+    @pytest.mark.parametrize(
+        "register_type, device_registers, db_num, expected",
+        [
+            ("input_registers", {0: 1, 10_000: 2, -1: 3}, 1, b"\x00\x01"),
+            ("discrete_inputs", {0: True, 10_000: True, -1: True}, 3, b"\x01"),
+        ],
+    )
+    async def test_sync_from_device_ignores_out_of_range(
+        self, started_s7_server, register_type, device_registers, db_num, expected
+    ):
+        """Test addresses before the DB start or past its end are skipped.
+
+        WHY: Device maps may be larger than the configured DB, and a negative
+        address must not wrap to the end of the buffer or abort the sync.
+        """
+        await started_s7_server.sync_from_device(device_registers, register_type)
+
+        buffer = started_s7_server._db_buffers[db_num]
+        assert buffer[: len(expected)] == expected
+        assert not any(buffer[len(expected) :])
 
-    @pytest.mark.asyncio
     async def test_sync_from_device_when_not_running(self, mock_snap7):
         """Test sync when server not running.
 
@@ -287,55 +316,60 @@ class TestS7TCPServerDeviceSync:
         # Should not raise
         await server.sync_from_device({0: 100}, "input_registers")
 
-    @pytest.mark.asyncio
-    async def test_sync_to_device_holding_registers(self, mock_snap7):
-        """Test syncing holding registers from server to device.
+    @pytest.mark.parametrize(
+        "register_type, db_num, raw, count, expected",
+        [
+            # Commands from attacker via S7 must reach PLC (DB2)
+            (
+                "holding_registers",
+                2,
+                b"\x00\x2a\xff\xff\x01\x00",
+                3,
+                {0: 42, 1: -1, 2: 256},
+            ),
+            # Digital commands from attacker must reach PLC (DB4)
+            (
+                "coils",
+                4,
+                b"\x15",
+                5,
+                {0: True, 1: False, 2: True, 3: False, 4: True},
+            ),
+        ],
+    )
+    async def test_sync_to_device(
+        self, started_s7_server, register_type, db_num, raw, count, expected
+    ):
+        """Test syncing server DB values back to the device.
 
-        WHY: Commands from attacker via S7 must reach PLC (DB2).
+        WHY: Writes made by S7 clients must reach the PLC.
         """
-        mock_server_instance = Mock()
-        mock_server_instance.start = Mock()
-        mock_server_instance.get_status = Mock(return_value=1)
-        mock_server_instance.register_area = Mock()
-        mock_snap7.server.Server = Mock(return_value=mock_server_instance)
-
-        server = S7TCPServer()
-        await server.start()
-
-        # Mock get_int to return values
-        mock_snap7.util.get_int.return_value = 42
-
-        result = await server.sync_to_device(0, 3, "holding_registers")
-
-        assert len(result) == 3
-        assert 0 in result
-        assert 1 in result
-        assert 2 in result
-
-    @pytest.mark.asyncio
-    async def test_sync_to_device_coils(self, mock_snap7):
-        """Test syncing coils from server to device.
+        started_s7_server._db_buffers[db_num][: len(raw)] = raw
+
+        result = await started_s7_server.sync_to_device(0, count, register_type)
+
+        assert result == expected
+
+    @pytest.mark.parametrize(
+        "register_type, address, expected",
+        [
+            # DB2 holds 128 registers by default
+            ("holding_registers", 126, {126: 0, 127: 0}),
+            # DB4 holds 512 coils by default
+            ("coils", 510, {510: False, 511: False}),
+        ],
+    )
+    async def test_sync_to_device_truncates_at_db_end(
+        self, started_s7_server, register_type, address, expected
+    ):
+        """Test reads running past the DB end return only in-range addresses.
 
-        WHY: Digital commands from attacker must reach PLC (DB4).
+        WHY: Device maps may be larger than the configured DB.
         """
-        mock_server_instance = Mock()
-        mock_server_instance.start = Mock()
-        mock_server_instance.get_status = Mock(return_value=1)
-        mock_server_instance.register_area = Mock()
-        mock_snap7.server.Server = Mock(return_value=mock_server_instance)
+        result = await started_s7_server.sync_to_device(address, 10, register_type)
 
-        server = S7TCPServer()
-        await server.start()
-
-        # Mock get_bool to return values
-        mock_snap7.util.get_bool.return_value = True
-
-        result = await server.sync_to_device(0, 5, "coils")
-
-        assert len(result) == 5
-        assert all(result[i] is True for i in range(5))
+        assert result == expected
 
-    @pytest.mark.asyncio
     async def test_sync_to_device_when_not_running(self, mock_snap7):
         """Test sync when server not running.
 
@@ -354,20 +388,12 @@ class TestS7TCPServerDeviceSync:
 class TestS7TCPServerAttackPrimitives:
     """Test attack-relevant operations."""
 
-    @pytest.mark.asyncio
-    async def test_read_db(self, mock_snap7):
+    async def test_read_db(self, started_s7_server):
         """Test reading Data Block.
 
         WHY: Attackers need to exfiltrate PLC data.
         """
-        mock_server_instance = Mock()
-        mock_server_instance.start = Mock()
-        mock_server_instance.get_status = Mock(return_value=1)
-        mock_server_instance.register_area = Mock()
-        mock_snap7.server.Server = Mock(return_value=mock_server_instance)
-
-        server = S7TCPServer()
-        await server.start()
+        server = started_s7_server
 
         # Write some test data
         server._db_buffers[1][0:4] = b"\x01\x02\x03\x04"
@@ -376,27 +402,18 @@ class TestS7TCPServerAttackPrimitives:
 
         assert result == b"\x01\x02\x03\x04"
 
-    @pytest.mark.asyncio
-    async def test_write_db(self, mock_snap7):
+    async def test_write_db(self, started_s7_server):
         """Test writing Data Block.
 
         WHY: Attackers need to modify PLC data.
         """
-        mock_server_instance = Mock()
-        mock_server_instance.start = Mock()
-        mock_server_instance.get_status = Mock(return_value=1)
-        mock_server_instance.register_area = Mock()
-        mock_snap7.server.Server = Mock(return_value=mock_server_instance)
-
-        server = S7TCPServer()
-        await server.start()
+        server = started_s7_server
 
         await server.write_db(2, 0, b"\xaa\xbb\xcc\xdd")
 
         # Verify data was written
-        assert bytes(server._db_buffers[2][0:4]) == b"\xaa\xbb\xcc\xdd"
+        assert server._db_buffers[2][0:4] == b"\xaa\xbb\xcc\xdd"
 
-    @pytest.mark.asyncio
     async def test_read_db_when_not_running(self, mock_snap7):
         """Test read_db when server not running.
 
@@ -407,7 +424,6 @@ class TestS7TCPServerAttackPrimitives:
         with pytest.raises(RuntimeError, match="not running"):
             await server.read_db(1, 0, 10)
 
-    @pytest.mark.asyncio
     async def test_write_db_when_not_running(self, mock_snap7):
         """Test write_db when server not running.
 
@@ -418,59 +434,33 @@ class TestS7TCPServerAttackPrimitives:
         with pytest.raises(RuntimeError, match="not running"):
             await server.write_db(1, 0, b"\x00")
 
-    @pytest.mark.asyncio
-    async def test_read_db_invalid_db_number(self, mock_snap7):
+    async def test_read_db_invalid_db_number(self, started_s7_server):
         """Test reading non-existent DB.
 
         WHY: Should raise RuntimeError for invalid DB.
         """
-        mock_server_instance = Mock()
-        mock_server_instance.start = Mock()
-        mock_server_instance.get_status = Mock(return_value=1)
-        mock_server_instance.register_area = Mock()
-        mock_snap7.server.Server = Mock(return_value=mock_server_instance)
-
-        server = S7TCPServer()
-        await server.start()
+        server = started_s7_server
 
         with pytest.raises(RuntimeError, match="not available"):
             await server.read_db(99, 0, 10)
 
-    @pytest.mark.asyncio
-    async def test_read_db_beyond_bounds(self, mock_snap7):
-        """Test reading beyond DB bounds.
-
-        WHY: Should raise ValueError.
-        """
-        mock_server_instance = Mock()
-        mock_server_instance.start = Mock()
-        mock_server_instance.get_status = Mock(return_value=1)
-        mock_server_instance.register_area = Mock()
-        mock_snap7.server.Server = Mock(return_value=mock_server_instance)
-
-        server = S7TCPServer(db1_size=100)
-        await server.start()
-
-        with pytest.raises(ValueError, match="beyond.*bounds"):
-            await server.read_db(1, 90, 20)  # Would read past end
-
-    @pytest.mark.asyncio
-    async def test_write_db_beyond_bounds(self, mock_snap7):
-        """Test writing beyond DB bounds.
-
-        WHY: Should raise ValueError.
+    @pytest.mark.parametrize(
+        "method, args",
+        [
+            ("read_db", (1, 90, 20)),  # Would read past end
+            ("write_db", (2, 95, b"\x00" * 10)),  # Would write past end
+            ("read_db", (1, -1, 4)),  # Negative offset
+        ],
+    )
+    async def test_db_access_beyond_bounds(self, mock_snap7, method, args):
+        """Test DB access outside the configured size.
+
+        WHY: Should raise ValueError - bounds need no running server.
         """
-        mock_server_instance = Mock()
-        mock_server_instance.start = Mock()
-        mock_server_instance.get_status = Mock(return_value=1)
-        mock_server_instance.register_area = Mock()
-        mock_snap7.server.Server = Mock(return_value=mock_server_instance)
-
-        server = S7TCPServer(db2_size=100)
-        await server.start()
+        server = S7TCPServer(db1_size=100, db2_size=100)
 
         with pytest.raises(ValueError, match="beyond.*bounds"):
-            await server.write_db(2, 95, b"\x00" * 10)
+            await getattr(server, method)(*args)
 
 
 # ================================================================
@@ -495,6 +485,13 @@ class TestS7TCPServerInfo:
         assert info["running"] is False
         assert info["db_sizes"] == server.db_sizes
 
+    def test_get_info_reports_running(self, started_s7_server):
+        """Test info reflects the live running flag.
+
+        WHY: Only the running flag changes after construction.
+        """
+        assert started_s7_server.get_info()["running"] is True
+
 
 # ================================================================
 # SNAP7 UNAVAILABLE TESTS
@@ -502,7 +499,6 @@ class TestS7TCPServerInfo:
 class TestS7TCPServerWithoutSnap7:
     """Test behavior when snap7 library is not available."""
 
-    @pytest.mark.asyncio
     async def test_start_without_snap7(self):
         """Test starting server when snap7 not available.
 
@@ -0,0 +1,50 @@
+# tests/unit/network/test_servers_package.py
+"""Tests for lazy loading in the components.network.servers package."""
+
+import subprocess
+import sys
+
+import pytest
+
+import components.network.servers as servers
+
+
+# ================================================================
+# LAZY IMPORT TESTS
+# ================================================================
+class TestServersPackageLazyImport:
+    """Test server classes load on first access."""
+
+    def test_import_does_not_load_server_modules(self):
+        """Test importing the package leaves server modules unloaded.
+
+        WHY: Each server drags in its protocol library; a Modbus-only run
+        should not pay for asyncua or snap7.
+        """
+        code = (
+            "import sys, components.network.servers; "
+            "print(any(m.startswith('components.network.servers.') "
+            "for m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False"
+
+    @pytest.mark.parametrize("name", servers.__all__)
+    def test_attribute_resolves_to_server_class(self, name):
+        """Test every exported name resolves to its class.
+
+        WHY: Existing `from components.network.servers import X` callers must
+        keep working.
+        """
+        server_class = getattr(servers, name)
+
+        assert server_class.__name__ == name
+        assert dir(servers).count(name) == 1
+
+    def test_unknown_attribute_raises(self):
+        """Test unknown names raise AttributeError."""
+        with pytest.raises(AttributeError, match="NoSuchServer"):
+            servers.NoSuchServer  # noqa: B018
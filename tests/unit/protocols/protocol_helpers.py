@@ -0,0 +1,34 @@
+# tests/unit/protocols/protocol_helpers.py
+"""Helpers shared by the protocol wrapper unit tests."""
+
+import inspect
+from functools import cache
+
+
+@cache
+def cached_signature(fn):
+    """Signature of a method under test, introspected once per session."""
+    return inspect.signature(fn)
+
+
+class AsyncStub:
+    """Minimal awaitable stand-in for AsyncMock.
+
+    Records positional args of each await in ``calls`` and either raises
+    ``side_effect`` or returns ``return_value``.
+    """
+
+    def __init__(self, return_value=None):
+        self.reset(return_value)
+
+    def reset(self, return_value=None):
+        """Forget recorded calls and restore the given return value."""
+        self.return_value = return_value
+        self.side_effect = None
+        self.calls = []
+
+    async def __call__(self, *args):
+        self.calls.append(args)
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
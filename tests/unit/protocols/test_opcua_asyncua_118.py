@@ -0,0 +1,65 @@
+# tests/unit/protocols/test_opcua_asyncua_118.py
+"""
+Unit tests for OPCUAAsyncua118Adapter.
+
+Tests the OPC UA adapter using asyncua library v1.1.8.
+Server start-up is not exercised here; these tests cover the
+node lookup paths that run without a live asyncua server.
+"""
+
+import pytest
+
+from components.protocols.opcua.opcua_asyncua_118 import OPCUAAsyncua118Adapter
+
+
+# ================================================================
+# FIXTURES
+# ================================================================
+@pytest.fixture
+def adapter():
+    """Create OPCUAAsyncua118Adapter instance."""
+    return OPCUAAsyncua118Adapter(endpoint="opc.tcp://127.0.0.1:4840/")
+
+
+@pytest.fixture
+def running_adapter(adapter):
+    """Adapter flagged as running with no variables registered."""
+    adapter._running = True
+    return adapter
+
+
+# ================================================================
+# NODE ACCESS TESTS
+# ================================================================
+class TestOPCUAAsyncua118AdapterNodeAccess:
+    """Test OPCUAAsyncua118Adapter node lookups."""
+
+    async def test_protocol_read_invalid_node(self, running_adapter):
+        """Test reading an unknown node raises KeyError."""
+        with pytest.raises(
+            KeyError, match=r"No OPC UA variable named 'InvalidNodeName'"
+        ):
+            await running_adapter.read_node("InvalidNodeName")
+
+    async def test_protocol_write_invalid_node(self, running_adapter):
+        """Test writing an unknown node raises KeyError."""
+        with pytest.raises(
+            KeyError, match=r"No OPC UA variable named 'InvalidNodeName'"
+        ):
+            await running_adapter.write_node("InvalidNodeName", 1.0)
+
+    async def test_set_variable_invalid_name(self, adapter):
+        """Test setting an unknown variable raises KeyError."""
+        with pytest.raises(
+            KeyError, match=r"No OPC UA variable named 'InvalidNodeName'"
+        ):
+            await adapter.set_variable("InvalidNodeName", 1.0)
+
+    async def test_read_node_when_not_running(self, adapter):
+        """Test reading before start raises RuntimeError."""
+        with pytest.raises(RuntimeError, match="Server not running"):
+            await adapter.read_node("Temperature")
+
+    async def test_browse_root_when_not_running(self, adapter):
+        """Test browsing before start returns no nodes."""
+        assert await adapter.browse_root() == []
@@ -0,0 +1,118 @@
+# tests/unit/protocols/test_snap7_202.py
+"""
+Unit tests for Snap7Adapter202.
+
+Tests the Siemens S7 adapter using python-snap7 v2.0.2.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Mock snap7 before importing Snap7Adapter202
+snap7_mock = MagicMock()
+
+with patch.dict(
+    "sys.modules",
+    {
+        "snap7": snap7_mock,
+        "snap7.client": snap7_mock.client,
+        "snap7.util": snap7_mock.util,
+    },
+):
+    from components.protocols.s7 import snap7_202  # noqa: E402
+
+Snap7Adapter202 = snap7_202.Snap7Adapter202
+
+
+@pytest.fixture(autouse=True)
+def mock_snap7():
+    """Mock snap7 client for all tests (covers an already-imported module)."""
+    with patch.object(snap7_202, "snap7", snap7_mock):
+        yield snap7_mock
+
+
+# ================================================================
+# INITIALIZATION TESTS
+# ================================================================
+class TestSnap7Adapter202Initialization:
+    """Test Snap7Adapter202 initialization."""
+
+    def test_init_defaults(self):
+        """Test initialization with default parameters.
+
+        WHY: Defaults target a local simulator on rack 0, slot 1.
+        """
+        adapter = Snap7Adapter202()
+
+        assert adapter.host == "127.0.0.1"
+        assert adapter.rack == 0
+        assert adapter.slot == 1
+        assert adapter.simulator_mode is True
+        assert adapter._connected is False
+
+    @pytest.mark.parametrize("rack,slot", [(0, 0), (0, 1), (0, 2), (1, 1)])
+    def test_rack_slot_configuration(self, rack, slot):
+        """Test rack/slot addressing is stored as given.
+
+        WHY: S7-300/400/1200/1500 CPUs live at different rack/slot positions.
+        """
+        adapter = Snap7Adapter202(rack=rack, slot=slot)
+
+        assert (adapter.rack, adapter.slot) == (rack, slot)
+
+    @pytest.mark.parametrize(
+        "host", ["127.0.0.1", "192.168.1.1", "10.0.0.1", "plc.example.com"]
+    )
+    def test_host_configuration(self, host):
+        """Test host accepts IP addresses and hostnames.
+
+        WHY: Targets may be addressed either way on a plant network.
+        """
+        adapter = Snap7Adapter202(host=host)
+
+        assert adapter.host == host
+
+
+# ================================================================
+# INTERFACE TESTS
+# ================================================================
+@pytest.fixture(scope="class")
+def adapter_interface():
+    """Shared adapter for attribute-only checks (never connected)."""
+    return Snap7Adapter202()
+
+
+@pytest.mark.no_io
+class TestSnap7Adapter202Interface:
+    """Test Snap7Adapter202 exposes the S7Protocol adapter interface."""
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "connect",
+            "disconnect",
+            "probe",
+            "read_db",
+            "write_db",
+            "read_bool",
+            "write_bool",
+            "stop_plc",
+            "start_plc",
+        ],
+    )
+    def test_has_interface_method(self, adapter_interface, name):
+        """Test adapter provides each method S7Protocol calls.
+
+        WHY: S7Protocol duck-types its adapter.
+        """
+        assert callable(getattr(adapter_interface, name, None))
+
+    async def test_probe_when_not_connected(self, adapter_interface):
+        """Test probe reports disconnected state without touching the PLC.
+
+        WHY: Recon output must be safe before a connection exists.
+        """
+        result = await adapter_interface.probe()
+
+        assert result == {"protocol": "s7", "connected": False}
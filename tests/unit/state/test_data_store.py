@@ -70,6 +70,35 @@ class TestDataStoreDeviceRegistration:
         device = await data_store.get_device_state("test_plc")
         assert device.metadata == metadata
 
+    @pytest.mark.asyncio
+    async def test_register_devices_delegates_to_system_state(self):
+        """Test that register_devices passes the batch to SystemState.
+
+        WHY: Startup registers every configured device through this call.
+        """
+        system_state = SystemState()
+        data_store = DataStore(system_state)
+
+        result = await data_store.register_devices(
+            [
+                {
+                    "device_name": "plc_1",
+                    "device_type": "turbine_plc",
+                    "device_id": 1,
+                    "protocols": ["modbus"],
+                },
+                {
+                    "device_name": "plc_2",
+                    "device_type": "hvac_plc",
+                    "device_id": 2,
+                    "protocols": [],
+                },
+            ]
+        )
+
+        assert result == 2
+        assert set(await system_state.get_all_devices()) == {"plc_1", "plc_2"}
+
     @pytest.mark.asyncio
     async def test_unregister_device_delegates_to_system_state(self):
         """Test that unregister_device properly delegates.
@@ -135,6 +135,103 @@ class TestSystemStateDeviceRegistration:
         assert len(state.devices) == 3
         assert state.simulation.total_devices == 3
 
+    @pytest.mark.asyncio
+    async def test_register_devices_batch(self):
+        """Test registering several devices in one call.
+
+        WHY: Startup registers many devices - one lock acquisition, not N.
+        """
+        state = SystemState()
+        await state.register_device("plc_1", "turbine_plc", 1, ["modbus"])
+
+        added = await state.register_devices(
+            [
+                {
+                    "device_name": "plc_1",
+                    "device_type": "turbine_plc",
+                    "device_id": 1,
+                    "protocols": ["modbus"],
+                },
+                {
+                    "device_name": "scada_1",
+                    "device_type": "scada_server",
+                    "device_id": 3,
+                    "protocols": ["dnp3"],
+                    "metadata": {"zone": "control"},
+                },
+            ]
+        )
+
+        assert added == 1  # plc_1 was a replacement
+        assert state.simulation.total_devices == 2
+        device = await state.get_device("scada_1")
+        assert device.metadata == {"zone": "control"}
+
+    @pytest.mark.asyncio
+    async def test_register_devices_validates_before_storing(self):
+        """Test a bad spec rejects the whole batch.
+
+        WHY: A half-applied batch would leave state inconsistent with config.
+        """
+        state = SystemState()
+
+        with pytest.raises(ValueError, match="device_type"):
+            await state.register_devices(
+                [
+                    {
+                        "device_name": "plc_1",
+                        "device_type": "turbine_plc",
+                        "device_id": 1,
+                        "protocols": ["modbus"],
+                    },
+                    {
+                        "device_name": "plc_2",
+                        "device_type": "",
+                        "device_id": 2,
+                        "protocols": ["modbus"],
+                    },
+                ]
+            )
+
+        assert state.devices == {}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "bad_spec, match",
+        [
+            ({"device_name": "plc_2", "device_type": "turbine_plc"}, "missing"),
+            (
+                {
+                    "device_name": "plc_2",
+                    "device_type": "turbine_plc",
+                    "device_id": 2,
+                    "protocols": [],
+                    "location": "Hall 2",
+                },
+                "unknown",
+            ),
+        ],
+    )
+    async def test_register_devices_rejects_malformed_spec(self, bad_spec, match):
+        """Test a spec with missing or unknown keys rejects the whole batch.
+
+        WHY: Such specs would otherwise fail with TypeError midway through,
+        after earlier devices were already stored.
+        """
+        state = SystemState()
+        good_spec = {
+            "device_name": "plc_1",
+            "device_type": "turbine_plc",
+            "device_id": 1,
+            "protocols": ["modbus"],
+        }
+
+        with pytest.raises(ValueError, match=match):
+            await state.register_devices([good_spec, bad_spec])
+
+        assert state.devices == {}
+        assert await state.get_devices_by_type("turbine_plc") == []
+
     @pytest.mark.asyncio
     async def test_register_device_rejects_empty_name(self):
         """Test that empty device name is rejected.
@@ -291,6 +388,22 @@ class TestSystemStateDeviceUnregistration:
 class TestSystemStateUpdates:
     """Test device state update functionality."""
 
+    @pytest.mark.asyncio
+    async def test_device_state_rejects_unknown_fields(self):
+        """Test DeviceState only carries its declared fields.
+
+        WHY: The state records are slotted, so a misspelt attribute write
+        fails loudly instead of silently adding a field.
+        """
+        state = SystemState()
+        await state.register_device("test_plc", "turbine_plc", 1, ["modbus"])
+        device = await state.get_device("test_plc")
+
+        with pytest.raises(AttributeError):
+            device.onlne = True
+        with pytest.raises(AttributeError):
+            state.simulation.runnning = True
+
     @pytest.mark.asyncio
     async def test_update_device_online_status(self):
         """Test updating device online status.
@@ -479,6 +592,26 @@ class TestSystemStateUpdates:
 class TestSystemStateQueries:
     """Test state query functionality."""
 
+    @pytest.mark.asyncio
+    async def test_device_filters_return_registration_order(self):
+        """Test type/protocol lookups list devices in registration order.
+
+        WHY: SimulatorManager builds its physics engines from these lists;
+        hash-seed-dependent order would change engine order between runs.
+        """
+        state = SystemState()
+        names = [f"turbine_plc_{i}" for i in (3, 1, 12, 7, 2, 9, 4, 11, 5, 8)]
+        for device_id, name in enumerate(names):
+            await state.register_device(name, "turbine_plc", device_id, ["modbus"])
+
+        # Re-registering without changing type/protocols keeps the position
+        await state.register_device(names[0], "turbine_plc", 0, ["modbus"])
+
+        by_type = await state.get_devices_by_type("turbine_plc")
+        by_protocol = await state.get_devices_by_protocol("modbus")
+        assert [d.device_name for d in by_type] == names
+        assert [d.device_name for d in by_protocol] == names
+
     @pytest.mark.asyncio
     async def test_get_device_returns_device(self):
         """Test getting a specific device.
@@ -598,6 +731,28 @@ class TestSystemStateQueries:
 
         assert devices == []
 
+    @pytest.mark.asyncio
+    async def test_device_filters_follow_reregistration_and_removal(self):
+        """Test type/protocol filters track replaced and removed devices.
+
+        WHY: Filters are served from indexes that must not go stale.
+        """
+        state = SystemState()
+        await state.register_device("plc_1", "turbine_plc", 1, ["modbus"])
+        await state.register_device("plc_1", "reactor_plc", 1, ["s7"])
+        await state.register_device("rtu_1", "rtu", 2, ["dnp3"])
+        await state.unregister_device("rtu_1")
+
+        assert await state.get_devices_by_type("turbine_plc") == []
+        assert await state.get_devices_by_protocol("modbus") == []
+        assert await state.get_devices_by_protocol("dnp3") == []
+        assert [
+            d.device_name for d in await state.get_devices_by_type("reactor_plc")
+        ] == ["plc_1"]
+        assert [d.device_name for d in await state.get_devices_by_protocol("s7")] == [
+            "plc_1"
+        ]
+
     @pytest.mark.asyncio
     async def test_get_simulation_state(self):
         """Test getting overall simulation state.
@@ -743,6 +898,40 @@ class TestSystemStateSummary:
         assert protocols["modbus"] == 2
         assert protocols["dnp3"] == 2
 
+    @pytest.mark.asyncio
+    async def test_get_summary_counts_after_removal(self):
+        """Test type and protocol counts drop removed devices.
+
+        WHY: Counts come from indexes - emptied entries must not linger.
+        """
+        state = SystemState()
+        await state.register_device("plc_1", "turbine_plc", 1, ["modbus"])
+        await state.register_device("rtu_1", "rtu", 2, ["dnp3"])
+        await state.unregister_device("rtu_1")
+
+        summary = await state.get_summary()
+
+        assert summary["device_types"] == {"turbine_plc": 1}
+        assert summary["protocols"] == {"modbus": 1}
+
+    @pytest.mark.asyncio
+    async def test_get_summary_counts_repeated_protocol_entries(self):
+        """Test a protocol listed twice by one device counts twice.
+
+        WHY: Protocol counts tally protocol entries, not distinct devices,
+        including after the device is re-registered.
+        """
+        state = SystemState()
+        await state.register_device("plc_1", "turbine_plc", 1, ["modbus", "modbus"])
+        await state.register_device("plc_2", "turbine_plc", 2, ["modbus", "s7"])
+        await state.register_device("plc_1", "turbine_plc", 1, ["modbus", "modbus"])
+
+        summary = await state.get_summary()
+        by_protocol = await state.get_devices_by_protocol("modbus")
+
+        assert summary["protocols"] == {"modbus": 3, "s7": 1}
+        assert [d.device_name for d in by_protocol] == ["plc_1", "plc_2"]
+
 
 # ================================================================
 # LIFECYCLE TESTS
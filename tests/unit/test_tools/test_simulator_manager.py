@@ -7,12 +7,16 @@ and physics engine coordination.
 """
 
 import asyncio
+import atexit
+import logging
+import signal
+from logging.handlers import QueueHandler
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
-from tools.simulator_manager import SimulatorManager
+from tools.simulator_manager import SimulatorManager, _start_log_listener
 
 # ================================================================
 # FIXTURES
@@ -112,12 +116,13 @@ class TestDeviceRegistration:
     async def test_register_devices_success(self, manager, minimal_config):
         """Test successful device registration."""
         with (
-            patch.object(manager.data_store, "register_device") as mock_register,
+            patch.object(manager.data_store, "register_devices") as mock_register,
             patch.object(manager.data_store, "set_device_online") as mock_online,
         ):
             await manager._register_devices(minimal_config)
 
             mock_register.assert_called_once()
+            assert len(mock_register.call_args.args[0]) == 1
             mock_online.assert_called_once_with("test_turbine_plc", True)
 
     @pytest.mark.asyncio
@@ -135,13 +140,13 @@ class TestDeviceRegistration:
         }
 
         with (
-            patch.object(manager.data_store, "register_device") as mock_register,
+            patch.object(manager.data_store, "register_devices") as mock_register,
             patch.object(manager.data_store, "set_device_online"),
         ):
             await manager._register_devices(config)
 
-            call_kwargs = mock_register.call_args.kwargs
-            assert "modbus" in call_kwargs["protocols"]
+            (spec,) = mock_register.call_args.args[0]
+            assert "modbus" in spec["protocols"]
 
     @pytest.mark.asyncio
     async def test_register_devices_skips_invalid(self, manager):
@@ -153,7 +158,7 @@ class TestDeviceRegistration:
             ]
         }
 
-        with patch.object(manager.data_store, "register_device") as mock_register:
+        with patch.object(manager.data_store, "register_devices") as mock_register:
             await manager._register_devices(config)
 
             assert mock_register.call_count == 0
@@ -163,11 +168,33 @@ class TestDeviceRegistration:
         """Test handling of empty device configuration."""
         config = {"devices": []}
 
-        with patch.object(manager.data_store, "register_device") as mock_register:
+        with patch.object(manager.data_store, "register_devices") as mock_register:
             await manager._register_devices(config)
 
             assert mock_register.call_count == 0
 
+    @pytest.mark.asyncio
+    async def test_register_devices_batches_into_state(self, manager):
+        """Test valid devices are registered and set online in one pass.
+
+        WHY: Registration goes through a single batched SystemState call.
+        """
+        config = {
+            "devices": [
+                {"name": "plc_1", "type": "turbine_plc", "protocols": {"s7": {}}},
+                {"name": "bad"},
+                {"name": "plc_2", "type": "hvac_plc", "device_id": 7},
+            ]
+        }
+
+        await manager._register_devices(config)
+
+        devices = await manager.system_state.get_all_devices()
+        assert set(devices) == {"plc_1", "plc_2"}
+        assert devices["plc_1"].protocols == ["s7"]
+        assert devices["plc_2"].device_id == 7
+        assert all(device.online for device in devices.values())
+
 
 # ================================================================
 # PHYSICS ENGINE TESTS
@@ -359,6 +386,32 @@ class TestSimulationLifecycle:
             mock_server1.stop.assert_called_once()
             mock_server2.stop.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_stop_stops_protocol_servers_concurrently(self, manager):
+        """Test that server shutdowns overlap instead of running one by one."""
+        manager._running = True
+        in_flight = 0
+        peak = 0
+
+        async def slow_stop():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+
+        manager.protocol_servers = {
+            f"server{i}": AsyncMock(stop=slow_stop) for i in range(3)
+        }
+
+        with (
+            patch.object(manager.sim_time, "stop"),
+            patch.object(manager.data_store, "mark_simulation_running"),
+        ):
+            await manager.stop()
+
+        assert peak == 3
+
     @pytest.mark.asyncio
     async def test_stop_stops_devices(self, manager):
         """Test that stop() stops all device instances."""
@@ -421,6 +474,53 @@ class TestSimulationLifecycle:
             mock_stop.assert_called_once()
             assert manager._initialised is False
 
+    @pytest.mark.asyncio
+    async def test_ensure_started_is_idempotent(self, manager):
+        """Test concurrent and repeated ensure_started() bring up once.
+
+        WHY: A second initialise/start would re-register devices and try to
+        re-bind every protocol server port.
+        """
+
+        async def fake_initialise():
+            await asyncio.sleep(0)
+            manager._initialised = True
+
+        async def fake_start():
+            await asyncio.sleep(0)
+            manager._running = True
+
+        with (
+            patch.object(manager, "initialise", side_effect=fake_initialise) as init,
+            patch.object(manager, "start", side_effect=fake_start) as start,
+        ):
+            await asyncio.gather(manager.ensure_started(), manager.ensure_started())
+            await manager.ensure_started()
+
+        init.assert_awaited_once()
+        start.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_run_installs_bounded_io_executor(self, manager):
+        """Test run() swaps in a small default executor and shuts it down.
+
+        WHY: Blocking protocol calls use asyncio.to_thread; the stock pool
+        starts far more threads than the simulator needs.
+        """
+        loop = asyncio.get_running_loop()
+        with (
+            patch.object(loop, "set_default_executor") as mock_set,
+            patch.object(manager, "setup_signal_handlers"),
+            patch.object(manager, "ensure_started", AsyncMock()),
+            patch.object(manager, "wait_for_shutdown", AsyncMock()),
+        ):
+            await manager.run()
+
+        (executor,) = mock_set.call_args.args
+        assert executor._max_workers == 4
+        with pytest.raises(RuntimeError):
+            executor.submit(print)
+
 
 # ================================================================
 # STATUS AND MONITORING TESTS
@@ -504,6 +604,221 @@ class TestPhysicsEngineLookup:
         assert result is None
 
 
+# ================================================================
+# SERVICE EXPOSURE TESTS
+# ================================================================
+
+
+class TestServiceExposure:
+    """Test protocol server creation in _expose_services."""
+
+    @pytest.mark.asyncio
+    async def test_expose_services_dispatches_by_protocol(self, manager):
+        """Test each protocol goes to its builder and unknown ones are skipped.
+
+        WHY: A failing builder must not stop the other servers, and protocols
+        without a server are still exposed in the topology.
+        """
+        s7_server = Mock(start=AsyncMock(return_value=True))
+        config = {
+            "devices": [
+                {
+                    "name": "plc",
+                    "protocols": {
+                        "s7": {"port": "102"},
+                        "dnp3": {"port": 20000},
+                        "iec61850": {"port": 102},
+                        "serial": {"port": "/dev/ttyS0"},
+                    },
+                }
+            ]
+        }
+
+        with (
+            patch.object(manager.network_sim, "expose_service") as mock_expose,
+            patch.object(
+                manager, "_build_s7_server", return_value=s7_server
+            ) as mock_s7,
+            patch.object(
+                manager, "_build_dnp3_server", side_effect=RuntimeError("boom")
+            ),
+        ):
+            await manager._expose_services(config)
+
+        mock_s7.assert_called_once_with(
+            config["devices"][0], {"port": "102"}, 102, config
+        )
+        assert [c.args[1] for c in mock_expose.call_args_list] == [
+            "s7",
+            "dnp3",
+            "iec61850",
+        ]
+        assert manager.protocol_servers == {"plc:s7": s7_server}
+
+    @pytest.mark.asyncio
+    @pytest.mark.asyncio
+    async def test_expose_services_builds_opcua_server(self, manager):
+        """Test an OPC UA device gets a started server.
+
+        WHY: The OPC UA builder reads its security settings from the loaded
+        config; a bad lookup there silently dropped every OPC UA server.
+        """
+        config = {
+            "devices": [{"name": "hist", "protocols": {"opcua": {"port": 4840}}}],
+        }
+
+        with (
+            patch.object(manager.network_sim, "expose_service"),
+            patch("components.network.servers.OPCUAServer") as mock_cls,
+        ):
+            mock_cls.return_value.start = AsyncMock(return_value=True)
+            await manager._expose_services(config)
+
+        mock_cls.assert_called_once_with(
+            endpoint="opc.tcp://0.0.0.0:4840/",
+            security_policy="None",
+            certificate_path=None,
+            private_key_path=None,
+            allow_anonymous=True,
+            auth_manager=None,
+        )
+        assert manager.protocol_servers == {"hist:opcua": mock_cls.return_value}
+
+    def test_build_opcua_server_applies_security_config(self, manager):
+        """Test global opcua_security settings and per-server overrides apply."""
+        config = {
+            "opcua_security": {
+                "enforcement_enabled": True,
+                "security_policy": "Basic256Sha256",
+                "cert_dir": "pki",
+                "server_overrides": {"hist": {"allow_anonymous": True}},
+            }
+        }
+
+        with patch("components.network.servers.OPCUAServer") as mock_cls:
+            server = manager._build_opcua_server(
+                {"name": "hist"}, {"port": 4840}, 4840, config
+            )
+
+        assert server is mock_cls.return_value
+        kwargs = mock_cls.call_args.kwargs
+        assert kwargs["security_policy"] == "Basic256Sha256"
+        assert kwargs["allow_anonymous"] is True
+        assert kwargs["certificate_path"] == "pki/hist.crt"
+        assert kwargs["private_key_path"] == "pki/hist.key"
+
+    @pytest.mark.parametrize(
+        "start_effect,registered",
+        [
+            ({"return_value": True}, True),
+            ({"return_value": False}, False),
+            ({"side_effect": OSError("port in use")}, False),
+        ],
+    )
+    async def test_start_server_records_only_started(
+        self, manager, start_effect, registered
+    ):
+        """Test a server is recorded only when start() succeeds.
+
+        WHY: _start_server swallows failures so one bad port cannot abort
+        the gathered start-up of every other server.
+        """
+        server = Mock(start=AsyncMock(**start_effect))
+
+        await manager._start_server("rtu", "dnp3", server, 20000)
+
+        assert ("rtu:dnp3" in manager.protocol_servers) is registered
+
+
+# ================================================================
+# PROTOCOL SYNC TESTS
+# ================================================================
+
+
+class TestProtocolServerSync:
+    """Test per-tick device ↔ server synchronisation."""
+
+    def test_build_sync_targets_pairs_devices_with_servers(self, manager):
+        """Test only devices with a synced server become targets.
+
+        WHY: The sync runs every tick; devices without servers should not
+        cost a key lookup each time.
+        """
+        plc, rtu, idle = Mock(), Mock(), Mock()
+        modbus, s7, dnp3 = Mock(), Mock(), Mock()
+        manager.device_instances = {"plc": plc, "rtu": rtu, "idle": idle}
+        manager.protocol_servers = {
+            "plc:modbus": modbus,
+            "plc:s7": s7,
+            "rtu:dnp3": dnp3,
+            "rtu:opcua": Mock(),
+        }
+
+        manager._build_sync_targets()
+
+        assert manager._sync_targets == [
+            ("plc", plc, modbus, "modbus"),
+            ("plc", plc, s7, "s7"),
+            ("rtu", rtu, dnp3, "dnp3"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sync_dispatches_by_protocol(self, manager):
+        """Test DNP3 targets use the DNP3 data model, others the register one."""
+        device = Mock(memory_map={"input_registers[0]": 7})
+        modbus, dnp3 = AsyncMock(), AsyncMock()
+        manager._sync_targets = [
+            ("plc", device, modbus, "modbus"),
+            ("rtu", device, dnp3, "dnp3"),
+        ]
+
+        await manager._sync_protocol_servers()
+
+        modbus.sync_from_device.assert_awaited_once_with({0: 7}, "input_registers")
+        dnp3.sync_from_device.assert_awaited_once_with({0: 7}, "analog_inputs")
+
+
+# ================================================================
+# LOGGING TESTS
+# ================================================================
+
+
+class TestLogListener:
+    """Test queue-based logging setup."""
+
+    def test_start_log_listener_writes_off_thread(self, tmp_path, monkeypatch):
+        """Test records reach the log file through the queue listener.
+
+        WHY: Console and file writes are blocking I/O and must not run on
+        the event loop thread.
+        """
+        root = logging.getLogger()
+        monkeypatch.setattr(root, "handlers", [])
+        monkeypatch.setattr(root, "level", root.level)
+        log_file = tmp_path / "simulation.log"
+
+        listener = _start_log_listener(log_file)
+        try:
+            assert [type(h) for h in root.handlers] == [QueueHandler]
+            logging.getLogger("tests.sim").info("queued %s", "record")
+        finally:
+            atexit.unregister(listener.stop)
+            listener.stop()
+            listener.handlers[1].close()
+
+        assert "tests.sim - INFO - queued record" in log_file.read_text()
+
+    def test_start_log_listener_respects_existing_config(self, tmp_path):
+        """Test an already-configured root logger is left alone."""
+        root = logging.getLogger()
+        existing = logging.NullHandler()
+        root.addHandler(existing)
+        try:
+            assert _start_log_listener(tmp_path / "simulation.log") is None
+        finally:
+            root.removeHandler(existing)
+
+
 # ================================================================
 # SIGNAL HANDLING TESTS
 # ================================================================
@@ -520,6 +835,24 @@ class TestSignalHandling:
             # Should register SIGINT and SIGTERM
             assert mock_signal.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_setup_signal_handlers_uses_running_loop(self, manager):
+        """Test handlers go on the event loop when one is running.
+
+        WHY: Loop handlers run as ordinary callbacks, so SIGTERM from a
+        container runtime shuts down as cleanly as Ctrl+C.
+        """
+        loop = asyncio.get_running_loop()
+        with (
+            patch.object(loop, "add_signal_handler") as mock_add,
+            patch("tools.simulator_manager.signal.signal") as mock_signal,
+        ):
+            manager.setup_signal_handlers()
+
+        registered = [c.args[0] for c in mock_add.call_args_list]
+        assert registered == [signal.SIGINT, signal.SIGTERM]
+        mock_signal.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_wait_for_shutdown(self, manager):
         """Test waiting for shutdown signal."""
@@ -531,6 +864,39 @@ class TestSignalHandling:
 
         assert manager._shutdown_event.is_set()
 
+    @pytest.mark.asyncio
+    async def test_signal_handler_wakes_shutdown_waiter(self, manager):
+        """Test the installed handler releases wait_for_shutdown.
+
+        WHY: run() blocks on the event rather than polling, so the handler
+        is the only thing that ends it on Ctrl+C.
+        """
+        loop = asyncio.get_running_loop()
+        with patch.object(loop, "add_signal_handler") as mock_add:
+            manager.setup_signal_handlers()
+        callback, *args = mock_add.call_args.args[1:]
+
+        callback(*args)
+        await asyncio.wait_for(manager.wait_for_shutdown(), timeout=1.0)
+
+        assert manager._shutdown_event.is_set()
+
+    @pytest.mark.asyncio
+    async def test_simulation_loop_failure_triggers_shutdown(self, manager):
+        """Test a crashed simulation loop sets the shutdown event.
+
+        WHY: Otherwise run() waits forever on a simulator that has stopped.
+        """
+        manager._running = True
+        manager.sim_time = Mock(now=Mock(side_effect=[0.0, 1.0]))
+        manager._update_simulation = AsyncMock(side_effect=RuntimeError("boom"))
+
+        with patch.object(manager.config_loader, "load_all", return_value={}):
+            await manager._simulation_loop()
+
+        assert manager._running is False
+        assert manager._shutdown_event.is_set()
+
 
 # ================================================================
 # ERROR HANDLING TESTS
@@ -20,9 +20,13 @@ Integrates:
 """
 
 import asyncio
+import atexit
 import logging
+import queue
 import signal
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any
 
@@ -39,17 +43,61 @@ from components.state.system_state import SystemState
 from components.time.simulation_time import SimulationTime, wait_simulation_time
 from config.config_loader import ConfigLoader
 
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    # uvloop is optional (not available on Windows); fall back to asyncio
+    UVLOOP_AVAILABLE = False
+
+
+def _start_log_listener(log_file: Path) -> QueueListener | None:
+    """Route root logging through a queue drained by a background thread.
+
+    The event loop only enqueues records; line formatting and the blocking
+    console/file writes happen on the listener thread. Like logging.basicConfig, this
+    does nothing if the root logger already has handlers.
+
+    Args:
+        log_file: File receiving a copy of every record
+
+    Returns:
+        The started listener, or None if logging was already configured
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return None
+
+    formatter = logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    handlers = [logging.StreamHandler(), logging.FileHandler(log_file)]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    listener.start()
+    # Flush whatever is still queued when the process exits
+    atexit.register(listener.stop)
+    return listener
+
+
 # Configure logging
 log_dir = Path("logs")
 log_dir.mkdir(exist_ok=True)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler(), logging.FileHandler(log_dir / "simulation.log")],
-)
+_start_log_listener(log_dir / "simulation.log")
 logger = logging.getLogger(__name__)
 
+# Protocols that listen on a TCP/IP port and are exposed in the topology
+NETWORK_PROTOCOLS = frozenset(
+    {"modbus", "s7", "dnp3", "opcua", "iec61850", "ethernet_ip", "iec104"}
+)
+
 
 class SimulatorManager:
     """
@@ -108,6 +156,10 @@ class SimulatorManager:
         # Protocol servers
         self.protocol_servers: dict[str, Any] = {}
 
+        # Flat (device_name, device, server, protocol) list walked every
+        # tick by _sync_protocol_servers; rebuilt when servers start
+        self._sync_targets: list[tuple[str, Any, Any, str]] = []
+
         # Simulation state
         self._running = False
         self._paused = False
@@ -121,6 +173,9 @@ class SimulatorManager:
         # Signal handling
         self._shutdown_event = asyncio.Event()
 
+        # Serialises ensure_started() so concurrent callers bring up once
+        self._startup_lock = asyncio.Lock()
+
         logger.info("SimulatorManager created")
 
     # ----------------------------------------------------------------
@@ -200,29 +255,39 @@ class SimulatorManager:
             logger.warning("No devices found in configuration")
             return
 
+        specs = []
         for device_cfg in devices:
-            device_name = device_cfg.get("name")
-            device_type = device_cfg.get("type")
-            device_id = device_cfg.get("device_id", 1)
-            protocols = list(device_cfg.get("protocols", {}).keys())
-            metadata = {
-                "description": device_cfg.get("description", ""),
-                "location": device_cfg.get("location", ""),
-            }
+            cfg_get = device_cfg.get
+            device_name = cfg_get("name")
+            device_type = cfg_get("type")
 
             if not device_name or not device_type:
                 logger.warning(f"Skipping invalid device config: {device_cfg}")
                 continue
 
-            # Register device in state (even if no protocols for network topology)
-            await self.data_store.register_device(
-                device_name=device_name,
-                device_type=device_type,
-                device_id=device_id,
-                protocols=protocols,  # Can be empty list
-                metadata=metadata,
+            specs.append(
+                {
+                    "device_name": device_name,
+                    "device_type": device_type,
+                    "device_id": cfg_get("device_id", 1),
+                    # Can be empty list (still needed for network topology)
+                    "protocols": list(cfg_get("protocols", {})),
+                    "metadata": {
+                        "description": cfg_get("description", ""),
+                        "location": cfg_get("location", ""),
+                    },
+                }
             )
 
+        # Register all devices in state under one lock acquisition
+        if specs:
+            await self.data_store.register_devices(specs)
+
+        for spec in specs:
+            device_name = spec["device_name"]
+            device_type = spec["device_type"]
+            protocols = spec["protocols"]
+
             # Set device online (in real implementation, protocols would do this)
             await self.data_store.set_device_online(device_name, True)
 
@@ -681,38 +746,30 @@ class SimulatorManager:
         Args:
             config: Loaded configuration dictionary
         """
-        from components.network.servers import (
-            DNP3TCPServer,
-            IEC104TCPServer,
-            ModbusTCPServer,
-            OPCUAServer,
-            S7TCPServer,
-        )
-
         devices = config.get("devices", [])
 
+        # One builder per protocol with a server implementation; other
+        # network protocols are exposed in the topology only
+        server_builders = {
+            "modbus": self._build_modbus_server,
+            "s7": self._build_s7_server,
+            "dnp3": self._build_dnp3_server,
+            "iec104": self._build_iec104_server,
+            "opcua": self._build_opcua_server,
+        }
+
         # Separate Modbus servers (sequential) from others (parallel)
         # Modbus uses pymodbus ModbusDeviceIdentification which has shared class attributes
         modbus_servers = []  # List of (device_name, proto_name, server_obj, port)
-        other_server_tasks = []  # Tasks for parallel execution
-        other_server_metadata = []  # Metadata for other servers
+        other_servers = []  # Same shape, started in parallel
 
         for device_cfg in devices:
             device_name = device_cfg.get("name")
-            device_id = device_cfg.get("device_id", 1)
             protocols_cfg = device_cfg.get("protocols", {})
 
             for proto_name, proto_cfg in protocols_cfg.items():
                 # Skip non-network protocols (serial, etc.)
-                if proto_name not in [
-                    "modbus",
-                    "s7",
-                    "dnp3",
-                    "opcua",
-                    "iec61850",
-                    "ethernet_ip",
-                    "iec104",
-                ]:
+                if proto_name not in NETWORK_PROTOCOLS:
                     continue
 
                 port = proto_cfg.get("port")
@@ -732,258 +789,251 @@ class SimulatorManager:
                 # Expose service in network simulator (topology)
                 await self.network_sim.expose_service(device_name, proto_name, port)
 
-                # Create protocol server (will be started in parallel later)
-                if proto_name == "modbus":
-                    try:
-                        host = proto_cfg.get("host", "0.0.0.0")
-                        unit_id = proto_cfg.get("unit_id", 1)
-
-                        # Get device identity from config for realistic fingerprinting
-                        device_type = device_cfg.get("type", "")
-                        device_identities = config.get("device_identities", {})
-                        device_identity = device_identities.get(
-                            device_type, device_identities.get("default", {})
-                        )
-
-                        # Create Modbus TCP server with pymodbus simulator
-                        server = ModbusTCPServer(
-                            host=host,
-                            port=port,
-                            unit_id=unit_id,
-                            num_coils=64,
-                            num_discrete_inputs=64,
-                            num_holding_registers=256,
-                            num_input_registers=256,
-                            device_identity=device_identity,
-                        )
-
-                        # Collect Modbus servers for sequential start (not parallel)
-                        modbus_servers.append((device_name, proto_name, server, port))
-
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to create {proto_name} server for {device_name}: {e}"
-                        )
-
-                elif proto_name == "s7":
-                    try:
-                        host = proto_cfg.get("host", "0.0.0.0")
-                        rack = proto_cfg.get("rack", 0)
-                        slot = proto_cfg.get("slot", 2)
-
-                        # Create S7 TCP server with snap7
-                        server = S7TCPServer(
-                            host=host,
-                            port=port,
-                            rack=rack,
-                            slot=slot,
-                            db1_size=256,  # Input registers
-                            db2_size=256,  # Holding registers
-                            db3_size=64,  # Discrete inputs
-                            db4_size=64,  # Coils
-                        )
-
-                        # Collect for parallel start
-                        other_server_tasks.append(server.start())
-                        other_server_metadata.append(
-                            (device_name, proto_name, server, port)
-                        )
-
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to create {proto_name} server for {device_name}: {e}"
-                        )
-
-                elif proto_name == "dnp3":
-                    try:
-                        host = proto_cfg.get("host", "0.0.0.0")
-                        master_address = proto_cfg.get("master_address", 1)
-                        outstation_address = proto_cfg.get(
-                            "outstation_address", device_id
-                        )
-
-                        # Create DNP3 TCP server (outstation)
-                        server = DNP3TCPServer(
-                            host=host,
-                            port=port,
-                            master_address=master_address,
-                            outstation_address=outstation_address,
-                            num_binary_inputs=64,
-                            num_analog_inputs=32,
-                            num_counters=16,
-                        )
-
-                        # Collect for parallel start
-                        other_server_tasks.append(server.start())
-                        other_server_metadata.append(
-                            (device_name, proto_name, server, port)
-                        )
-
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to create {proto_name} server for {device_name}: {e}"
-                        )
-
-                elif proto_name == "iec104":
-                    try:
-                        host = proto_cfg.get("host", "0.0.0.0")
-                        common_address = proto_cfg.get("common_address", 1)
-
-                        # Create IEC 104 TCP server
-                        server = IEC104TCPServer(
-                            host=host,
-                            port=port,
-                            common_address=common_address,
-                        )
-
-                        # Collect for parallel start
-                        other_server_tasks.append(server.start())
-                        other_server_metadata.append(
-                            (device_name, proto_name, server, port)
-                        )
-
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to create {proto_name} server for {device_name}: {e}"
-                        )
-
-                elif proto_name == "opcua":
-                    try:
-                        endpoint_url = proto_cfg.get(
-                            "endpoint",
-                            f"opc.tcp://{proto_cfg.get('host', '0.0.0.0')}:{port}/",
-                        )
-
-                        # Security configuration (optional)
-                        security_policy = proto_cfg.get("security_policy", "None")
-                        certificate_path = proto_cfg.get("certificate")
-                        private_key_path = proto_cfg.get("private_key")
-                        allow_anonymous = proto_cfg.get("allow_anonymous", True)
-
-                        # Apply global OPC UA security config
-                        opcua_sec = self.config.get("opcua_security", {})
-
-                        # Authentication enforcement (Challenge 1)
-                        opcua_auth_manager = None
-                        if opcua_sec.get("require_authentication", False):
-                            from components.security.authentication import (
-                                AuthenticationManager,
-                            )
-
-                            opcua_auth_manager = AuthenticationManager()
-                            allow_anonymous = False
-                            logger.info(
-                                f"OPC UA authentication enforcement: {device_name} "
-                                f"(users: {len(opcua_auth_manager.users)})"
-                            )
-
-                        # Encryption enforcement (Challenge 7)
-                        if opcua_sec.get("enforcement_enabled", False):
-                            # Check for per-server overrides first
-                            overrides = opcua_sec.get("server_overrides", {})
-                            server_override = overrides.get(device_name, {})
-
-                            security_policy = server_override.get(
-                                "security_policy",
-                                opcua_sec.get(
-                                    "security_policy", "Aes256_Sha256_RsaPss"
-                                ),
-                            )
-                            allow_anonymous = server_override.get(
-                                "allow_anonymous",
-                                opcua_sec.get("allow_anonymous", False),
-                            )
-
-                            # Use cert paths from device config or generate from cert_dir
-                            cert_dir = opcua_sec.get("cert_dir", "certs")
-                            if not certificate_path:
-                                certificate_path = f"{cert_dir}/{device_name}.crt"
-                            if not private_key_path:
-                                private_key_path = f"{cert_dir}/{device_name}.key"
-
-                            logger.info(
-                                f"OPC UA security enforcement: {device_name} "
-                                f"policy={security_policy}, anonymous={allow_anonymous}"
-                            )
-
-                        # Create OPC UA server with optional security
-                        server = OPCUAServer(
-                            endpoint=endpoint_url,
-                            security_policy=security_policy,
-                            certificate_path=certificate_path,
-                            private_key_path=private_key_path,
-                            allow_anonymous=allow_anonymous,
-                            auth_manager=opcua_auth_manager,
-                        )
-
-                        # Collect for parallel start
-                        other_server_tasks.append(server.start())
-                        other_server_metadata.append(
-                            (device_name, proto_name, server, port)
-                        )
-
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to create {proto_name} server for {device_name}: {e}"
-                        )
-
-                else:
+                build_server = server_builders.get(proto_name)
+                if build_server is None:
                     # Protocol not yet implemented
                     logger.info(
                         f"Exposed {proto_name} service (server not implemented): {device_name}:{port}"
                     )
+                    continue
+
+                # Create protocol server (will be started later)
+                try:
+                    server = build_server(device_cfg, proto_cfg, port, config)
+                except Exception as e:
+                    logger.error(
+                        f"Failed to create {proto_name} server for {device_name}: {e}"
+                    )
+                    continue
+
+                if proto_name == "modbus":
+                    # Collect Modbus servers for sequential start (not parallel)
+                    modbus_servers.append((device_name, proto_name, server, port))
+                else:
+                    # Collect for parallel start
+                    other_servers.append((device_name, proto_name, server, port))
 
         # Start Modbus servers SEQUENTIALLY (pymodbus class attribute workaround)
         if modbus_servers:
             logger.info(
                 f"Starting {len(modbus_servers)} Modbus servers sequentially..."
             )
-            for device_name, proto_name, server, port in modbus_servers:
-                try:
-                    result = await server.start()
-                    if result:
-                        server_key = f"{device_name}:{proto_name}"
-                        self.protocol_servers[server_key] = server
-                        logger.info(
-                            f"Started {proto_name} server: {device_name}:{port}"
-                        )
-                    else:
-                        logger.warning(
-                            f"{proto_name} server for {device_name}:{port} failed to start"
-                        )
-                except Exception as e:
-                    logger.error(
-                        f"Failed to start {proto_name} server for {device_name}:{port}: {e}"
-                    )
+            for entry in modbus_servers:
+                await self._start_server(*entry)
 
         # Start other servers in PARALLEL for fast initialization
-        if other_server_tasks:
+        if other_servers:
             logger.info(
-                f"Starting {len(other_server_tasks)} other protocol servers in parallel..."
+                f"Starting {len(other_servers)} other protocol servers in parallel..."
+            )
+            await asyncio.gather(
+                *(self._start_server(*entry) for entry in other_servers)
             )
 
-            # Run all server.start() calls concurrently
-            results = await asyncio.gather(*other_server_tasks, return_exceptions=True)
+        self._build_sync_targets()
 
-            # Process results and store successful servers
-            for i, (device_name, proto_name, server, port) in enumerate(
-                other_server_metadata
-            ):
-                result = results[i]
+    async def _start_server(
+        self, device_name: str, proto_name: str, server: Any, port: int
+    ) -> None:
+        """Start one protocol server, then log and record the outcome.
 
-                if isinstance(result, Exception):
-                    logger.error(
-                        f"Failed to start {proto_name} server for {device_name}:{port}: {result}"
-                    )
-                elif result:  # Server started successfully
-                    server_key = f"{device_name}:{proto_name}"
-                    self.protocol_servers[server_key] = server
-                    logger.info(f"Started {proto_name} server: {device_name}:{port}")
-                else:
-                    logger.warning(
-                        f"{proto_name} server for {device_name}:{port} failed to start - "
-                        "library may not be installed or port unavailable"
-                    )
+        Never raises, so callers can gather these without return_exceptions.
+        """
+        try:
+            started = await server.start()
+        except Exception as e:
+            logger.error(
+                f"Failed to start {proto_name} server for {device_name}:{port}: {e}"
+            )
+            return
+
+        if started:
+            self.protocol_servers[f"{device_name}:{proto_name}"] = server
+            logger.info(f"Started {proto_name} server: {device_name}:{port}")
+        else:
+            logger.warning(
+                f"{proto_name} server for {device_name}:{port} failed to start - "
+                "library may not be installed or port unavailable"
+            )
+
+    def _build_sync_targets(self) -> None:
+        """Flatten device/server pairs for the per-tick sync.
+
+        Resolves the "{device}:{protocol}" server keys once, so each tick
+        walks only the devices that actually have a synced server.
+        """
+        self._sync_targets = [
+            (device_name, device, server, proto_name)
+            for device_name, device in self.device_instances.items()
+            for proto_name in ("modbus", "s7", "dnp3")
+            if (server := self.protocol_servers.get(f"{device_name}:{proto_name}"))
+        ]
+
+    # ----------------------------------------------------------------
+    # Protocol server builders
+    # ----------------------------------------------------------------
+    # Server classes are imported per protocol, so only the protocol
+    # libraries this config actually uses get loaded
+
+    def _build_modbus_server(
+        self,
+        device_cfg: dict[str, Any],
+        proto_cfg: dict[str, Any],
+        port: int,
+        config: dict[str, Any],
+    ) -> Any:
+        """Create a Modbus TCP server with the device's identity."""
+        from components.network.servers import ModbusTCPServer
+
+        # Get device identity from config for realistic fingerprinting
+        device_identities = config.get("device_identities", {})
+        device_identity = device_identities.get(
+            device_cfg.get("type", ""), device_identities.get("default", {})
+        )
+
+        return ModbusTCPServer(
+            host=proto_cfg.get("host", "0.0.0.0"),
+            port=port,
+            unit_id=proto_cfg.get("unit_id", 1),
+            num_coils=64,
+            num_discrete_inputs=64,
+            num_holding_registers=256,
+            num_input_registers=256,
+            device_identity=device_identity,
+        )
+
+    def _build_s7_server(
+        self,
+        device_cfg: dict[str, Any],
+        proto_cfg: dict[str, Any],
+        port: int,
+        config: dict[str, Any],
+    ) -> Any:
+        """Create an S7 TCP server with snap7."""
+        from components.network.servers import S7TCPServer
+
+        return S7TCPServer(
+            host=proto_cfg.get("host", "0.0.0.0"),
+            port=port,
+            rack=proto_cfg.get("rack", 0),
+            slot=proto_cfg.get("slot", 2),
+            db1_size=256,  # Input registers
+            db2_size=256,  # Holding registers
+            db3_size=64,  # Discrete inputs
+            db4_size=64,  # Coils
+        )
+
+    def _build_dnp3_server(
+        self,
+        device_cfg: dict[str, Any],
+        proto_cfg: dict[str, Any],
+        port: int,
+        config: dict[str, Any],
+    ) -> Any:
+        """Create a DNP3 TCP server (outstation)."""
+        from components.network.servers import DNP3TCPServer
+
+        return DNP3TCPServer(
+            host=proto_cfg.get("host", "0.0.0.0"),
+            port=port,
+            master_address=proto_cfg.get("master_address", 1),
+            outstation_address=proto_cfg.get(
+                "outstation_address", device_cfg.get("device_id", 1)
+            ),
+            num_binary_inputs=64,
+            num_analog_inputs=32,
+            num_counters=16,
+        )
+
+    def _build_iec104_server(
+        self,
+        device_cfg: dict[str, Any],
+        proto_cfg: dict[str, Any],
+        port: int,
+        config: dict[str, Any],
+    ) -> Any:
+        """Create an IEC 104 TCP server."""
+        from components.network.servers import IEC104TCPServer
+
+        return IEC104TCPServer(
+            host=proto_cfg.get("host", "0.0.0.0"),
+            port=port,
+            common_address=proto_cfg.get("common_address", 1),
+        )
+
+    def _build_opcua_server(
+        self,
+        device_cfg: dict[str, Any],
+        proto_cfg: dict[str, Any],
+        port: int,
+        config: dict[str, Any],
+    ) -> Any:
+        """Create an OPC UA server, applying the global security config."""
+        from components.network.servers import OPCUAServer
+
+        device_name = device_cfg.get("name")
+        endpoint_url = proto_cfg.get(
+            "endpoint",
+            f"opc.tcp://{proto_cfg.get('host', '0.0.0.0')}:{port}/",
+        )
+
+        # Security configuration (optional)
+        security_policy = proto_cfg.get("security_policy", "None")
+        certificate_path = proto_cfg.get("certificate")
+        private_key_path = proto_cfg.get("private_key")
+        allow_anonymous = proto_cfg.get("allow_anonymous", True)
+
+        # Apply global OPC UA security config
+        opcua_sec = config.get("opcua_security", {})
+
+        # Authentication enforcement (Challenge 1)
+        opcua_auth_manager = None
+        if opcua_sec.get("require_authentication", False):
+            from components.security.authentication import AuthenticationManager
+
+            opcua_auth_manager = AuthenticationManager()
+            allow_anonymous = False
+            logger.info(
+                f"OPC UA authentication enforcement: {device_name} "
+                f"(users: {len(opcua_auth_manager.users)})"
+            )
+
+        # Encryption enforcement (Challenge 7)
+        if opcua_sec.get("enforcement_enabled", False):
+            # Check for per-server overrides first
+            overrides = opcua_sec.get("server_overrides", {})
+            server_override = overrides.get(device_name, {})
+
+            security_policy = server_override.get(
+                "security_policy",
+                opcua_sec.get("security_policy", "Aes256_Sha256_RsaPss"),
+            )
+            allow_anonymous = server_override.get(
+                "allow_anonymous",
+                opcua_sec.get("allow_anonymous", False),
+            )
+
+            # Use cert paths from device config or generate from cert_dir
+            cert_dir = opcua_sec.get("cert_dir", "certs")
+            if not certificate_path:
+                certificate_path = f"{cert_dir}/{device_name}.crt"
+            if not private_key_path:
+                private_key_path = f"{cert_dir}/{device_name}.key"
+
+            logger.info(
+                f"OPC UA security enforcement: {device_name} "
+                f"policy={security_policy}, anonymous={allow_anonymous}"
+            )
+
+        # Create OPC UA server with optional security
+        return OPCUAServer(
+            endpoint=endpoint_url,
+            security_policy=security_policy,
+            certificate_path=certificate_path,
+            private_key_path=private_key_path,
+            allow_anonymous=allow_anonymous,
+            auth_manager=opcua_auth_manager,
+        )
 
     async def _log_summary(self) -> None:
         """Log initialisation summary."""
@@ -1045,6 +1095,18 @@ class SimulatorManager:
         else:
             logger.info("No protocol servers configured")
 
+    async def ensure_started(self) -> None:
+        """Initialise and start the simulation unless already done.
+
+        Idempotent and safe to call concurrently: later callers wait for
+        the first bring-up and then return without re-binding servers.
+        """
+        async with self._startup_lock:
+            if not self._initialised:
+                await self.initialise()
+            if not self._running:
+                await self.start()
+
     async def stop(self) -> None:
         """Stop the simulation gracefully.
 
@@ -1066,22 +1128,31 @@ class SimulatorManager:
             except asyncio.CancelledError:
                 pass
 
-        # Stop all protocol servers
-        for server_key, server in self.protocol_servers.items():
-            try:
-                await server.stop()
+        # Stop all protocol servers in PARALLEL (each releases its own port)
+        servers = list(self.protocol_servers.items())
+        results = await asyncio.gather(
+            *(server.stop() for _, server in servers), return_exceptions=True
+        )
+        for (server_key, _), result in zip(servers, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(f"Error stopping {server_key}: {result}")
+            else:
                 logger.info(f"Stopped protocol server: {server_key}")
-            except Exception as e:
-                logger.error(f"Error stopping {server_key}: {e}")
 
-        # Stop all device instances
-        for device_name, device in self.device_instances.items():
-            try:
-                if hasattr(device, "stop"):
-                    await device.stop()
-                    logger.info(f"Stopped device: {device_name}")
-            except Exception as e:
-                logger.error(f"Error stopping device {device_name}: {e}")
+        # Stop all device instances in PARALLEL
+        devices = [
+            (device_name, device)
+            for device_name, device in self.device_instances.items()
+            if hasattr(device, "stop")
+        ]
+        results = await asyncio.gather(
+            *(device.stop() for _, device in devices), return_exceptions=True
+        )
+        for (device_name, _), result in zip(devices, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(f"Error stopping device {device_name}: {result}")
+            else:
+                logger.info(f"Stopped device: {device_name}")
 
         # Stop simulation time
         await self.sim_time.stop()
@@ -1206,6 +1277,8 @@ class SimulatorManager:
         except Exception as e:
             logger.error(f"Error in simulation loop: {e}", exc_info=True)
             self._running = False
+            # Release run() now rather than leaving it parked on a dead loop
+            self._shutdown_event.set()
 
     async def _update_simulation(self, dt: float) -> None:
         """Perform one simulation update cycle.
@@ -1262,125 +1335,110 @@ class SimulatorManager:
 
         Handles Modbus, S7, and DNP3 protocol servers.
         """
-        for device_name, device in self.device_instances.items():
-            # Check for Modbus server
-            modbus_key = f"{device_name}:modbus"
-            modbus_server = self.protocol_servers.get(modbus_key)
-
-            # Check for S7 server
-            s7_key = f"{device_name}:s7"
-            s7_server = self.protocol_servers.get(s7_key)
-
-            # Check for DNP3 server
-            dnp3_key = f"{device_name}:dnp3"
-            dnp3_server = self.protocol_servers.get(dnp3_key)
-
-            # Sync with Modbus/S7 servers (same data model)
-            for server in [modbus_server, s7_server]:
-                if not server:
-                    continue
+        for device_name, device, server, proto_name in self._sync_targets:
+            if proto_name == "dnp3":
+                await self._sync_dnp3_server(device_name, device, server)
+            else:
+                # Modbus and S7 servers share the register data model
+                await self._sync_register_server(device_name, device, server)
 
-                try:
-                    # Extract registers from device memory_map
-                    memory_map = device.memory_map
-
-                    # Device → Server (telemetry)
-                    input_registers = {}
-                    discrete_inputs = {}
-                    for key, value in memory_map.items():
-                        if key.startswith("input_registers["):
-                            # Extract address from "input_registers[100]"
-                            addr = int(key.split("[")[1].split("]")[0])
-                            input_registers[addr] = value
-                        elif key.startswith("discrete_inputs["):
-                            addr = int(key.split("[")[1].split("]")[0])
-                            discrete_inputs[addr] = value
-
-                    if input_registers:
-                        await server.sync_from_device(
-                            input_registers, "input_registers"
-                        )
-                    if discrete_inputs:
-                        await server.sync_from_device(
-                            discrete_inputs, "discrete_inputs"
-                        )
-
-                    # Server → Device (commands)
-                    # Find coils range
-                    coil_addrs = [
-                        int(k.split("[")[1].split("]")[0])
-                        for k in memory_map.keys()
-                        if k.startswith("coils[")
-                    ]
-                    if coil_addrs:
-                        min_addr = min(coil_addrs)
-                        max_addr = max(coil_addrs)
-                        coils_from_server = await server.sync_to_device(
-                            min_addr, max_addr - min_addr + 1, "coils"
-                        )
-                        for addr, value in coils_from_server.items():
-                            device.memory_map[f"coils[{addr}]"] = value
-
-                    # Find holding registers range
-                    hr_addrs = [
-                        int(k.split("[")[1].split("]")[0])
-                        for k in memory_map.keys()
-                        if k.startswith("holding_registers[")
-                    ]
-                    if hr_addrs:
-                        min_addr = min(hr_addrs)
-                        max_addr = max(hr_addrs)
-                        regs_from_server = await server.sync_to_device(
-                            min_addr, max_addr - min_addr + 1, "holding_registers"
-                        )
-                        for addr, value in regs_from_server.items():
-                            key = f"holding_registers[{addr}]"
-                            if key in device.memory_map:
-                                device.memory_map[key] = value
+    async def _sync_register_server(
+        self, device_name: str, device: Any, server: Any
+    ) -> None:
+        """Sync one device with a Modbus or S7 server."""
+        try:
+            # Extract registers from device memory_map
+            memory_map = device.memory_map
+
+            # Device → Server (telemetry)
+            input_registers = {}
+            discrete_inputs = {}
+            for key, value in memory_map.items():
+                if key.startswith("input_registers["):
+                    # Extract address from "input_registers[100]"
+                    addr = int(key.split("[")[1].split("]")[0])
+                    input_registers[addr] = value
+                elif key.startswith("discrete_inputs["):
+                    addr = int(key.split("[")[1].split("]")[0])
+                    discrete_inputs[addr] = value
+
+            if input_registers:
+                await server.sync_from_device(input_registers, "input_registers")
+            if discrete_inputs:
+                await server.sync_from_device(discrete_inputs, "discrete_inputs")
+
+            # Server → Device (commands)
+            # Find coils range
+            coil_addrs = [
+                int(k.split("[")[1].split("]")[0])
+                for k in memory_map.keys()
+                if k.startswith("coils[")
+            ]
+            if coil_addrs:
+                min_addr = min(coil_addrs)
+                max_addr = max(coil_addrs)
+                coils_from_server = await server.sync_to_device(
+                    min_addr, max_addr - min_addr + 1, "coils"
+                )
+                for addr, value in coils_from_server.items():
+                    device.memory_map[f"coils[{addr}]"] = value
+
+            # Find holding registers range
+            hr_addrs = [
+                int(k.split("[")[1].split("]")[0])
+                for k in memory_map.keys()
+                if k.startswith("holding_registers[")
+            ]
+            if hr_addrs:
+                min_addr = min(hr_addrs)
+                max_addr = max(hr_addrs)
+                regs_from_server = await server.sync_to_device(
+                    min_addr, max_addr - min_addr + 1, "holding_registers"
+                )
+                for addr, value in regs_from_server.items():
+                    key = f"holding_registers[{addr}]"
+                    if key in device.memory_map:
+                        device.memory_map[key] = value
 
-                except Exception as e:
-                    logger.error(
-                        f"Failed to sync {device_name} with protocol server: {e}"
-                    )
+        except Exception as e:
+            logger.error(f"Failed to sync {device_name} with protocol server: {e}")
 
-            # Sync with DNP3 server (different data model)
-            if dnp3_server:
-                try:
-                    # Extract data from device memory_map
-                    memory_map = device.memory_map
-
-                    # Device → Server (telemetry)
-                    # Map Modbus-style registers to DNP3 data model
-                    analog_inputs = {}  # DNP3 analog inputs
-                    binary_inputs = {}  # DNP3 binary inputs
-
-                    for key, value in memory_map.items():
-                        if key.startswith("input_registers["):
-                            # Map input_registers → analog_inputs
-                            addr = int(key.split("[")[1].split("]")[0])
-                            analog_inputs[addr] = value
-                        elif key.startswith("discrete_inputs["):
-                            # Map discrete_inputs → binary_inputs
-                            addr = int(key.split("[")[1].split("]")[0])
-                            binary_inputs[addr] = value
-
-                    # Sync to DNP3 server
-                    if analog_inputs:
-                        await dnp3_server.sync_from_device(
-                            analog_inputs, "analog_inputs"
-                        )
-                    if binary_inputs:
-                        await dnp3_server.sync_from_device(
-                            binary_inputs, "binary_inputs"
-                        )
-
-                    # Server → Device (commands)
-                    # DNP3 commands (Binary/Analog Outputs) would be synced here
-                    # Currently not fully implemented in DNP3 adapter
-                    # TODO: Add DNP3 command handling when adapter supports it
+    async def _sync_dnp3_server(
+        self, device_name: str, device: Any, dnp3_server: Any
+    ) -> None:
+        """Sync one device with a DNP3 server (different data model)."""
+        try:
+            # Extract data from device memory_map
+            memory_map = device.memory_map
+
+            # Device → Server (telemetry)
+            # Map Modbus-style registers to DNP3 data model
+            analog_inputs = {}  # DNP3 analog inputs
+            binary_inputs = {}  # DNP3 binary inputs
+
+            for key, value in memory_map.items():
+                if key.startswith("input_registers["):
+                    # Map input_registers → analog_inputs
+                    addr = int(key.split("[")[1].split("]")[0])
+                    analog_inputs[addr] = value
+                elif key.startswith("discrete_inputs["):
+                    # Map discrete_inputs → binary_inputs
+                    addr = int(key.split("[")[1].split("]")[0])
+                    binary_inputs[addr] = value
+
+            # Sync to DNP3 server
+            if analog_inputs:
+                await dnp3_server.sync_from_device(analog_inputs, "analog_inputs")
+            if binary_inputs:
+                await dnp3_server.sync_from_device(binary_inputs, "binary_inputs")
+
+            # Server → Device (commands)
+            # DNP3 commands (Binary/Analog Outputs) would be synced here
+            # Currently not fully implemented in DNP3 adapter
+            # TODO: Add DNP3 command handling when adapter supports it
 
-                except Exception as e:
-                    logger.error(f"Failed to sync {device_name} with DNP3 server: {e}")
+        except Exception as e:
+            logger.error(f"Failed to sync {device_name} with DNP3 server: {e}")
 
     # ----------------------------------------------------------------
     # Status and monitoring
@@ -1473,17 +1531,40 @@ class SimulatorManager:
     # ----------------------------------------------------------------
 
     def setup_signal_handlers(self) -> None:
-        """Set up signal handlers for graceful shutdown."""
+        """Set up signal handlers for graceful shutdown.
 
-        def signal_handler(signum, frame):
-            logger.info(f"Received signal {signum}")
-            self._shutdown_event.set()
+        SIGINT and SIGTERM only set the shutdown event. The running loop's
+        own handlers are used where supported; Windows (and callers without
+        a running loop) fall back to signal.signal.
+        """
+        signals = (signal.SIGINT, signal.SIGTERM)
+
+        try:
+            loop = asyncio.get_running_loop()
+            for signum in signals:
+                loop.add_signal_handler(signum, self._on_shutdown_signal, signum)
+        except (RuntimeError, NotImplementedError):
+
+            def signal_handler(signum, frame):
+                self._on_shutdown_signal(signum)
 
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+            for signum in signals:
+                signal.signal(signum, signal_handler)
 
         logger.info("Signal handlers configured")
 
+    def _on_shutdown_signal(self, signum: int) -> None:
+        """Record a shutdown signal and release wait_for_shutdown()."""
+        logger.info(f"Received signal {signum}")
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._shutdown_event.set()
+            return
+        # Go through the loop's self-pipe so a loop sleeping in select()
+        # wakes immediately instead of at its next timer
+        loop.call_soon_threadsafe(self._shutdown_event.set)
+
     async def wait_for_shutdown(self) -> None:
         """Wait for shutdown signal."""
         await self._shutdown_event.wait()
@@ -1497,15 +1578,13 @@ class SimulatorManager:
 
         Initialises, starts, and runs until interrupted.
         """
+        executor = self._install_io_executor()
         try:
             # Set up signal handlers
             self.setup_signal_handlers()
 
-            # Initialise
-            await self.initialise()
-
-            # Start simulation
-            await self.start()
+            # Initialise and start simulation
+            await self.ensure_started()
 
             # Wait for shutdown signal
             logger.info("Simulation running. Press Ctrl+C to stop.")
@@ -1519,14 +1598,30 @@ class SimulatorManager:
             logger.info("")
             await self.wait_for_shutdown()
 
-        except KeyboardInterrupt:
-            logger.info("KeyboardInterrupt received")
         except Exception as e:
             logger.error(f"Fatal error: {e}", exc_info=True)
         finally:
             # Clean shutdown
             if self._running:
                 await self.stop()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _install_io_executor(self) -> ThreadPoolExecutor:
+        """Give the running loop a default executor sized to the device count.
+
+        Blocking protocol library calls (snap7, DNP3, c104) go through
+        asyncio.to_thread. The stock executor allows min(32, cpu_count + 4)
+        threads, far more than a small plant ever keeps busy.
+
+        Returns:
+            The installed executor, for the caller to shut down
+        """
+        device_count = len(self.config_loader.load_all().get("devices", []))
+        executor = ThreadPoolExecutor(
+            max_workers=max(4, device_count // 2), thread_name_prefix="sim-io"
+        )
+        asyncio.get_running_loop().set_default_executor(executor)
+        return executor
 
 
 # ----------------------------------------------------------------
@@ -1536,6 +1631,11 @@ class SimulatorManager:
 
 async def main():
     """Main entry point."""
+    # Run new tasks eagerly up to their first real suspension (Python 3.12+);
+    # most device/server coroutines finish without ever yielding
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     logger.info("=== UU Power & Light ICS Simulator ===")
     logger.info("")
 
@@ -1545,4 +1645,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if UVLOOP_AVAILABLE:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())